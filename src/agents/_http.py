@@ -0,0 +1,31 @@
+"""
+🌐 Shared HTTP - 에이전트들이 같이 쓰는 httpx 커넥션 풀 (프로세스 단위)
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공용 AsyncClient (처음 필요할 때 생성, 이후 TLS/HTTP2 연결 재사용)
+
+    인증 헤더/긴 타임아웃은 요청마다 따로 지정
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,  # 같은 호스트 요청들이 연결 하나를 멀티플렉싱
+            timeout=httpx.Timeout(30, connect=5),
+            limits=httpx.Limits(max_connections=50,
+                                max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def aclose_http_client() -> None:
+    """공용 클라이언트 정리 (워크플로우 종료 시 호출, 다음 요청 때 새로 생성)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,84 @@
+"""
+🎞️ Video Common - 영상 합성 공통 상수 & 자막 렌더링 (프로세스 단위 캐시)
+"""
+
+import functools
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Short video dimensions (9:16 aspect ratio)
+WIDTH = 1080
+HEIGHT = 1920
+
+# 배경색 (이미지 없는 구간/페이드 시작색)
+BG_COLOR = (15, 15, 20)
+
+# 한글 폰트 (macOS 기본)
+FONT_PATH = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
+
+# 자막 스타일
+SUBTITLE_FONT_SIZE = 72  # 더 큰 글씨
+SUBTITLE_STROKE_WIDTH = 3  # 테두리 두께
+SUBTITLE_TEXT_WIDTH = WIDTH - 160  # 글씨 영역 너비
+SUBTITLE_PADDING_X = 40  # 좌우 패딩
+SUBTITLE_PADDING_Y = 30  # 상하 패딩
+
+
+@functools.lru_cache(maxsize=8)
+def get_font(size: int) -> ImageFont.FreeTypeFont:
+    """폰트 로드 (크기별로 한 번만)"""
+    return ImageFont.truetype(FONT_PATH, size)
+
+
+def _wrap_lines(text: str, font: ImageFont.FreeTypeFont,
+                max_width: int) -> list[str]:
+    """단어 단위로 max_width 안에 들어가게 줄바꿈"""
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and font.getlength(candidate) > max_width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+@functools.lru_cache(maxsize=256)
+def render_subtitle_tile(text: str) -> np.ndarray:
+    """자막 1개를 검정 박스 + 흰 글씨(검정 테두리) RGB 타일로 렌더링
+
+    배경이 불투명하므로 알파 없이 프레임에 그대로 덮어쓰면 됨.
+    같은 구절은 캐시에서 바로 반환 (읽기 전용 배열)
+    """
+    font = get_font(SUBTITLE_FONT_SIZE)
+    stroke = SUBTITLE_STROKE_WIDTH
+    lines = _wrap_lines(text, font, SUBTITLE_TEXT_WIDTH - stroke * 2)
+
+    ascent, descent = font.getmetrics()
+    line_h = ascent + descent + stroke * 2
+
+    tile_w = SUBTITLE_TEXT_WIDTH + SUBTITLE_PADDING_X * 2
+    tile_h = line_h * len(lines) + SUBTITLE_PADDING_Y * 2
+    tile = Image.new("RGB", (tile_w, tile_h), (0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+
+    # 줄마다 가운데 정렬
+    y = SUBTITLE_PADDING_Y + stroke
+    for line in lines:
+        x = (tile_w - font.getlength(line)) / 2
+        draw.text(
+            (x, y),
+            line,
+            font=font,
+            fill="white",
+            stroke_width=stroke,
+            stroke_fill="black",
+        )
+        y += line_h
+
+    return np.asarray(tile)
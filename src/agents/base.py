@@ -2,6 +2,7 @@
 🤖 Base Agent Class
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any, TypeVar, Generic
 
@@ -10,10 +11,12 @@ from botocore.config import Config
 from langchain_aws import ChatBedrock
 from pydantic import BaseModel
 
-from ..config import settings
+from ..config import get_settings
 
 T = TypeVar("T")
 
+log = logging.getLogger("agents")
+
 
 class BaseAgent(ABC, Generic[T]):
     """Base class for all agents"""
@@ -22,6 +25,7 @@ class BaseAgent(ABC, Generic[T]):
         # Initialize Bedrock client
         # AWS CLI credentials (~/.aws/credentials) 자동 사용
         # .env에 명시하면 그걸 우선 사용
+        settings = get_settings()
         client_kwargs = {"region_name": settings.aws.region}
 
         # .env에 키가 있으면 명시적으로 사용
@@ -58,6 +62,13 @@ class BaseAgent(ABC, Generic[T]):
         """Execute the agent's main task"""
         pass
 
-    def log(self, message: str) -> None:
-        """Log a message"""
-        print(f"[{self.name}] {message}")
+    def log(self, message: str, *args) -> None:
+        """Log a message (%-style args는 레벨이 켜져 있을 때만 포맷)"""
+        if log.isEnabledFor(logging.INFO):
+            log.info("[%s] %s", self.name, message % args if args else message)
+
+    def warn(self, message: str, *args) -> None:
+        """Log a failure/fallback (LOG_LEVEL=WARNING에서도 보임)"""
+        if log.isEnabledFor(logging.WARNING):
+            log.warning("[%s] %s", self.name,
+                        message % args if args else message)
@@ -4,15 +4,17 @@
 
 import asyncio
 import random
+import threading
 from pathlib import Path
 from typing import Optional
 
-import httpx
 import torch
 from diffusers import StableDiffusionPipeline, DPMSolverMultistepScheduler
 from PIL import Image
 
+from ..config import get_settings
 from ..models import ImageResult
+from ._http import get_http_client
 from .base import BaseAgent
 
 
@@ -102,8 +104,9 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
     def __init__(self):
         super().__init__()
         self._pipe: Optional[StableDiffusionPipeline] = None
-        self._protagonist: Optional[str] = None  # 주인공 캐릭터 (영상마다 고정)
-        self._protagonist_seed: Optional[int] = None  # 주인공 seed (일관성)
+        # 파이프라인(스케줄러 상태 포함)은 스레드 안전하지 않음 → 생성은 한 번에 하나씩
+        # 주인공/seed는 run마다 지역 변수로 넘겨서 동시 실행돼도 섞이지 않음
+        self._pipe_lock = threading.Lock()
 
     def _load_pipeline(self) -> StableDiffusionPipeline:
         """Load the Stable Diffusion pipeline (lazy loading)"""
@@ -130,16 +133,15 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
 
         # Try local model first, then HuggingFace
         if self.MODEL_PATH.exists():
-            self.log(f"Loading local model: {self.MODEL_PATH.name}")
+            self.log("Loading local model: %s", self.MODEL_PATH.name)
             self._pipe = StableDiffusionPipeline.from_single_file(
                 str(self.MODEL_PATH),
                 torch_dtype=dtype,
                 use_safetensors=True,
             )
         else:
-            self.log(
-                f"Local model not found, downloading from HuggingFace: {self.HF_MODEL}"
-            )
+            self.log("Local model not found, downloading from HuggingFace: %s",
+                     self.HF_MODEL)
             self._pipe = StableDiffusionPipeline.from_pretrained(
                 self.HF_MODEL,
                 torch_dtype=dtype,
@@ -163,7 +165,7 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
         hair = random.choice(self.HAIR_OPTIONS)
         # 간결하게: 머리 + 몸매만
         protagonist = f"{hair}, pretty face, large breasts"
-        self.log(f"🎭 주인공: {hair}")
+        self.log("🎭 주인공: %s", hair)
         return protagonist
 
     def _pick_outfit_and_background(self) -> tuple[str, str]:
@@ -172,7 +174,9 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
         background = random.choice(backgrounds)
         return outfit, background
 
-    def _pick_character_template(self, scene_prompt: str = "") -> str:
+    def _pick_character_template(self,
+                                 protagonist: str,
+                                 scene_prompt: str = "") -> str:
         """씬 내용에 맞는 캐릭터 템플릿 선택 - 씬 프롬프트가 주인공일 때만 캐릭터 추가"""
         scene_lower = scene_prompt.lower()
 
@@ -196,13 +200,13 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
         # 캐릭터 구성만 결정 (의상은 씬에서 가져옴)
         if has_man:
             # 남자가 나오는 씬
-            char = f"1boy 1girl, {self._protagonist}, handsome man"
+            char = f"1boy 1girl, {protagonist}, handsome man"
         elif has_two_girls:
             # 여자 둘
-            char = f"2girls, {self._protagonist}, another girl"
+            char = f"2girls, {protagonist}, another girl"
         else:
             # 기본 1girl
-            char = f"1girl, {self._protagonist}"
+            char = f"1girl, {protagonist}"
 
         # 씬에 의상이 없으면 랜덤 의상 추가
         if not has_outfit_in_scene:
@@ -219,97 +223,173 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
             width: int = 512,  # SD 1.5 해상도
             height: int = 680,  # 더 크롭되게 (위아래 많이 잘림)
     ) -> list[ImageResult]:
-        """Generate multiple images for the video"""
+        """Generate multiple images for the video
+
+        장면을 IMAGE_BATCH_SIZE개씩 묶어 generate_batch를 동시에 실행
+        (GPU 생성은 락으로 한 묶음씩, 리사이즈/저장은 다음 묶음 생성과 겹침).
+        결과는 장면 순서 유지
+        """
 
-        self.log(f"Generating {len(prompts)} images...")
+        self.log("Generating %s images...", len(prompts))
 
         # 🎭 영상마다 주인공 캐릭터 새로 생성 (이 영상 내에서는 고정)
-        self._protagonist = self._create_protagonist()
-        self._protagonist_seed = random.randint(1, 999999)
-        self.log(f"🎲 주인공 seed: {self._protagonist_seed}")
+        protagonist = self._create_protagonist()
+        protagonist_seed = random.randint(1, 999999)
+        self.log("🎲 주인공 seed: %s", protagonist_seed)
 
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        results = []
+        # 동시에 진행할 묶음 수 제한
+        settings = get_settings()
+        semaphore = asyncio.Semaphore(max(1, settings.image_concurrency))
+        # 파이프라인 한 번 호출에 같이 넣을 장면 수
+        batch_size = max(1, settings.image_batch_size)
+
+        async def bounded(start: int) -> list[Optional[ImageResult]]:
+            async with semaphore:
+                return await self.generate_batch(
+                    prompts[start:start + batch_size],
+                    start_index=start,
+                    output_dir=output_dir,
+                    protagonist=protagonist,
+                    protagonist_seed=protagonist_seed,
+                    character_prompt=character_prompt,
+                    width=width,
+                    height=height,
+                )
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(bounded(i))
+                for i in range(0, len(prompts), batch_size)
+            ]
+        results = [r for t in tasks for r in t.result() if r is not None]
+
+        self.log("Generated %s images", len(results))
+        return results
+
+    async def generate_batch(
+            self,
+            scene_prompts: list[str],
+            start_index: int,
+            output_dir: Path,
+            protagonist: Optional[str] = None,
+            protagonist_seed: Optional[int] = None,
+            character_prompt: Optional[str] = None,
+            width: int = 512,
+            height: int = 680,
+    ) -> list[Optional[ImageResult]]:
+        """연속된 장면들을 파이프라인 한 번 호출로 생성 → 각각 저장
+
+        결과는 scene_prompts 순서, 실패하면 그 묶음 전체가 None
+        """
+        prepared = [
+            self._prepare_prompt(p, protagonist, character_prompt)
+            for p in scene_prompts
+        ]
+        indices = range(start_index, start_index + len(prepared))
+        image_paths = [
+            Path(output_dir) / f"image_{i:03d}.png" for i in indices
+        ]
+
+        for i, (effect, actual_prompt, full_prompt) in zip(indices, prepared):
+            self.log("Generating image %s [%s]...", i+1, effect)
+            self.log("  📝 Scene: %s", actual_prompt)
+            self.log("  🎨 Full prompt: %.100s...", full_prompt)
 
-        # Load pipeline once
-        pipe = self._load_pipeline()
-
-        for i, scene_prompt in enumerate(prompts):
-            # 카메라 효과와 프롬프트 분리 (format: "effect|prompt")
-            effect = "static"
-            actual_prompt = scene_prompt
-            if "|" in scene_prompt:
-                parts = scene_prompt.split("|", 1)
-                effect = parts[0].strip()
-                actual_prompt = parts[1].strip()
-
-            # 씬 내용 분석해서 적절한 캐릭터 구성 선택
-            if character_prompt:
-                char_prompt = character_prompt
-            else:
-                char_prompt = self._pick_character_template(actual_prompt)
-
-            # 프롬프트 순서: 씬 내용 > 캐릭터 > 퀄리티 (CLIP은 앞부분 우선)
-            full_prompt = f"{actual_prompt}, {char_prompt}, {self.QUALITY_PROMPT}"
-
-            self.log(f"Generating image {i+1}/{len(prompts)} [{effect}]...")
-            self.log(f"  📝 Scene: {actual_prompt}")
-            self.log(f"  🎨 Full prompt: {full_prompt[:100]}...")
-
-            image_path = output_dir / f"image_{i:03d}.png"
-
-            try:
-                # Run generation in thread pool (sync -> async)
-                image = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: self._generate_sync(pipe, full_prompt, width,
-                                                      height))
-
-                # Resize to shorts format (9:16) - 1080x1920
-                shorts_image = self._resize_for_shorts(image)
-                shorts_image.save(image_path)
-
-                # 효과 정보를 프롬프트 앞에 유지 (video_agent에서 사용)
-                results.append(
-                    ImageResult(
-                        file_path=image_path,
-                        prompt=f"{effect}|{actual_prompt}",
-                        index=i,
-                    ))
-                self.log(f"✓ Image {i+1} saved")
-            except Exception as e:
-                self.log(f"Failed to generate image {i}: {e}")
-
-        self.log(f"Generated {len(results)} images")
+        try:
+            # Load pipeline once (이후 호출은 캐시된 파이프라인)
+            pipe = self._load_pipeline()
+
+            # Run generation in thread pool (sync -> async)
+            images = await asyncio.to_thread(self._generate_sync, pipe,
+                                             [p[2] for p in prepared], width,
+                                             height, protagonist_seed)
+
+            # Resize to shorts format (9:16) - 1080x1920
+            # 생성 락을 풀고 나서 저장 → 그동안 다음 묶음이 GPU 사용
+            async with asyncio.TaskGroup() as tg:
+                for image, path in zip(images, image_paths):
+                    tg.create_task(
+                        asyncio.to_thread(self._save_for_shorts, image, path))
+        except Exception as e:
+            self.warn("Failed to generate images %s: %s", list(indices), e)
+            return [None] * len(prepared)
+
+        results = []
+        for i, path, (effect, actual_prompt, _) in zip(indices, image_paths,
+                                                        prepared):
+            self.log("✓ Image %s saved", i+1)
+            # 효과 정보를 프롬프트 앞에 유지 (video_agent에서 사용)
+            results.append(
+                ImageResult(
+                    file_path=path,
+                    prompt=f"{effect}|{actual_prompt}",
+                    index=i,
+                ))
         return results
 
+    def _prepare_prompt(
+        self,
+        scene_prompt: str,
+        protagonist: Optional[str],
+        character_prompt: Optional[str],
+    ) -> tuple[str, str, str]:
+        """장면 프롬프트 → (카메라 효과, 장면 내용, SD에 넣을 전체 프롬프트)"""
+        # 카메라 효과와 프롬프트 분리 (format: "effect|prompt")
+        effect = "static"
+        actual_prompt = scene_prompt
+        if "|" in scene_prompt:
+            parts = scene_prompt.split("|", 1)
+            effect = parts[0].strip()
+            actual_prompt = parts[1].strip()
+
+        # 씬 내용 분석해서 적절한 캐릭터 구성 선택
+        if character_prompt:
+            char_prompt = character_prompt
+        else:
+            char_prompt = self._pick_character_template(
+                protagonist or self._create_protagonist(), actual_prompt)
+
+        # 프롬프트 순서: 씬 내용 > 캐릭터 > 퀄리티 (CLIP은 앞부분 우선)
+        full_prompt = f"{actual_prompt}, {char_prompt}, {self.QUALITY_PROMPT}"
+        return effect, actual_prompt, full_prompt
+
     def _generate_sync(
         self,
         pipe: StableDiffusionPipeline,
-        prompt: str,
+        prompts: list[str],
         width: int,
         height: int,
-        use_protagonist_seed: bool = True,
-    ) -> Image.Image:
-        """Synchronous image generation (called in thread pool)"""
+        protagonist_seed: Optional[int] = None,
+    ) -> list[Image.Image]:
+        """Synchronous batched generation (called in thread pool)"""
         # 주인공이 나오는 씬은 같은 seed 사용 (일관성)
         generator = None
-        if use_protagonist_seed and self._protagonist_seed:
-            # seed에 약간의 변화를 줘서 완전 똑같진 않게
-            seed = self._protagonist_seed + random.randint(0, 100)
-            generator = torch.Generator().manual_seed(seed)
-
-        result = pipe(
-            prompt=prompt,
-            negative_prompt=self.NEGATIVE_PROMPT,
-            width=width,
-            height=height,
-            num_inference_steps=25,
-            guidance_scale=7.0,
-            generator=generator,
-        )
-        return result.images[0]
+        if protagonist_seed:
+            # seed에 약간의 변화를 줘서 완전 똑같진 않게 (이미지마다 따로)
+            generator = [
+                torch.Generator().manual_seed(protagonist_seed +
+                                              random.randint(0, 100))
+                for _ in prompts
+            ]
+
+        with self._pipe_lock:
+            result = pipe(
+                prompt=prompts,
+                negative_prompt=[self.NEGATIVE_PROMPT] * len(prompts),
+                width=width,
+                height=height,
+                num_inference_steps=25,
+                guidance_scale=7.0,
+                generator=generator,
+            )
+        return result.images
+
+    def _save_for_shorts(self, image: Image.Image, path: Path) -> None:
+        """쇼츠 포맷으로 리사이즈 후 저장 (스레드에서 실행)"""
+        self._resize_for_shorts(image).save(path)
 
     def _resize_for_shorts(self, image: Image.Image) -> Image.Image:
         """
@@ -349,33 +429,33 @@ class ImageAgent(BaseAgent[list[ImageResult]]):
         Unsplash에서 무료 이미지 검색 & 다운로드
         주제에 맞는 실제 이미지 (은수저, 카페, 헬스장 등)
         """
-        self.log(f"Searching image for: {query}")
+        self.log("Searching image for: %s", query)
 
         try:
             # Unsplash API (무료, API 키 불필요한 방식)
-            async with httpx.AsyncClient(timeout=30) as client:
-                # 검색 URL (source.unsplash.com 리다이렉트 사용)
-                search_url = f"https://source.unsplash.com/800x600/?{query}"
+            # 검색 URL (source.unsplash.com 리다이렉트 사용)
+            search_url = f"https://source.unsplash.com/800x600/?{query}"
 
-                response = await client.get(search_url, follow_redirects=True)
+            response = await get_http_client().get(search_url,
+                                                  follow_redirects=True)
 
-                if response.status_code == 200:
-                    # 이미지 저장
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
+            if response.status_code == 200:
+                # 이미지 저장
+                output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                    with open(output_path, "wb") as f:
-                        f.write(response.content)
+                with open(output_path, "wb") as f:
+                    f.write(response.content)
 
-                    # 쇼츠 포맷으로 리사이즈
-                    img = Image.open(output_path)
-                    resized = self._resize_for_shorts(img)
-                    resized.save(output_path)
+                # 쇼츠 포맷으로 리사이즈
+                img = Image.open(output_path)
+                resized = self._resize_for_shorts(img)
+                resized.save(output_path)
 
-                    self.log(f"✓ Downloaded: {query}")
-                    return output_path
+                self.log("✓ Downloaded: %s", query)
+                return output_path
 
         except Exception as e:
-            self.log(f"Failed to search image: {e}")
+            self.warn("Failed to search image: %s", e)
 
         return None
 
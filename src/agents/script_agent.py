@@ -4,10 +4,12 @@
 
 from langchain_core.prompts import ChatPromptTemplate
 
-from ..config import settings
 from ..models import ContentTone, ContentType, Script, TrendData
 from .base import BaseAgent
 
+# LLM이 준 톤 문자열 → ContentTone (모르는 값은 기본 톤)
+_TONES_BY_VALUE: dict[str, ContentTone] = {t.value: t for t in ContentTone}
+
 SCRIPT_SYSTEM_PROMPT = """You are a viral YouTube Shorts scriptwriter who creates ADDICTIVE, jaw-dropping stories. Your scripts go VIRAL because:
 
 - HOOK: 첫 3초에 "뭐?!" 하게 만드는 충격적인 문장 (질문, 반전, 믿기 힘든 사실)
@@ -136,7 +138,7 @@ class ScriptAgent(BaseAgent[Script]):
         target_duration: float = 45.0,
     ) -> Script:
         """Generate a viral script from trend data"""
-        self.log(f"Generating script for: {trend.title[:50]}...")
+        self.log("Generating script for: %.50s...", trend.title)
 
         # Create prompt
         prompt = ChatPromptTemplate.from_messages([
@@ -162,9 +164,8 @@ class ScriptAgent(BaseAgent[Script]):
         # Parse response
         script = self._parse_script(response.content)
 
-        self.log(
-            f"Script generated: {len(script.full_text)} chars, {len(script.scene_prompts)} scenes"
-        )
+        self.log("Script generated: %s chars, %s scenes",
+                 len(script.full_text), len(script.scene_prompts))
         return script
 
     def _parse_script(self, response: str) -> Script:
@@ -239,12 +240,11 @@ class ScriptAgent(BaseAgent[Script]):
                             # Store as "effect|prompt" format
                             scene_prompts.append(f"{effect}|{scene_line}")
 
-        # Convert tone string to enum
-        try:
-            tone = ContentTone(tone_str)
-        except ValueError:
+        # Convert tone string to enum (예외 대신 값→멤버 dict 조회)
+        tone = _TONES_BY_VALUE.get(tone_str)
+        if tone is None:
             tone = ContentTone.DEFAULT
-            self.log(f"Unknown tone '{tone_str}', using default")
+            self.warn("Unknown tone '%s', using default", tone_str)
 
         script = Script(
             hook=hook.strip(),
@@ -255,7 +255,7 @@ class ScriptAgent(BaseAgent[Script]):
         )
         script.combine()
 
-        self.log(f"Detected tone: {tone.value}")
+        self.log("Detected tone: %s", tone.value)
         return script
 
     async def generate_metadata(
@@ -3,6 +3,8 @@
 각 Agent의 결과물을 평가하고 OK 사인을 내림
 """
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
@@ -59,10 +61,19 @@ SUGGESTIONS:
 class SupervisorAgent(BaseAgent[SupervisorFeedback]):
     """깐깐한 감독 Agent - 품질 평가 및 승인"""
 
+    # 같은 입력(렌더링된 프롬프트)에 대한 평가는 다시 묻지 않음
+    REVIEW_CACHE_SIZE = 256
+
     @property
     def name(self) -> str:
         return "👨‍💼 Supervisor"
 
+    def __init__(self):
+        super().__init__()
+        # 프롬프트 해시 → 피드백 (LRU)
+        self._review_cache: OrderedDict[bytes,
+                                        SupervisorFeedback] = OrderedDict()
+
     async def run(self, *args, **kwargs) -> SupervisorFeedback:
         """
         SupervisorAgent는 직접 run()을 호출하지 않고
@@ -73,7 +84,7 @@ class SupervisorAgent(BaseAgent[SupervisorFeedback]):
 
     async def review_trend(self, trend: TrendData) -> SupervisorFeedback:
         """트렌드 평가 - 바이럴 가능성 체크"""
-        self.log(f"Reviewing trend: {trend.title[:30]}...")
+        self.log("Reviewing trend: %.30s...", trend.title)
 
         prompt = ChatPromptTemplate.from_messages([
             ("system", SUPERVISOR_SYSTEM_PROMPT),
@@ -161,7 +172,7 @@ Reject if:
     async def review_images(self, images: list[ImageResult],
                             script: Script) -> SupervisorFeedback:
         """이미지 프롬프트 평가"""
-        self.log(f"Reviewing {len(images)} images...")
+        self.log("Reviewing %s images...", len(images))
 
         prompt = ChatPromptTemplate.from_messages([
             ("system", SUPERVISOR_SYSTEM_PROMPT),
@@ -200,7 +211,7 @@ Judge based on whether the prompts would generate appropriate visuals."""),
     async def review_audio(self, audio: AudioResult,
                            script: Script) -> SupervisorFeedback:
         """오디오 평가 - 길이 적절성"""
-        self.log(f"Reviewing audio ({audio.duration:.1f}s)...")
+        self.log("Reviewing audio (%.1fs)...", audio.duration)
 
         prompt = ChatPromptTemplate.from_messages([
             ("system", SUPERVISOR_SYSTEM_PROMPT),
@@ -296,11 +307,27 @@ Remember: This is your last chance to reject before video creation."""),
 
     async def _get_review(self, prompt: ChatPromptTemplate,
                           variables: dict) -> SupervisorFeedback:
-        """LLM에게 평가 요청"""
-        chain = prompt | self.llm
-        response = await chain.ainvoke(variables)
+        """LLM에게 평가 요청 (같은 프롬프트면 캐시된 평가 반환)
 
-        return self._parse_feedback(response.content)
+        프롬프트는 한 번만 렌더링해서 캐시 키와 LLM 호출에 같이 사용
+        """
+        messages = prompt.format_messages(**variables)
+        key = hashlib.blake2b(
+            "\0".join(m.content for m in messages).encode(),
+            digest_size=16).digest()
+        cached = self._review_cache.get(key)
+        if cached is not None:
+            self._review_cache.move_to_end(key)
+            self.log("♻️ Same content already reviewed - reusing verdict")
+            return cached
+
+        response = await self.llm.ainvoke(messages)
+
+        feedback = self._parse_feedback(response.content)
+        self._review_cache[key] = feedback
+        if len(self._review_cache) > self.REVIEW_CACHE_SIZE:
+            self._review_cache.popitem(last=False)
+        return feedback
 
     def _parse_feedback(self, response: str) -> SupervisorFeedback:
         """LLM 응답 파싱"""
@@ -353,7 +380,7 @@ Remember: This is your last chance to reject before video creation."""),
             result = ReviewResult.REJECTED
 
         emoji = "✅" if result == ReviewResult.APPROVED else "❌" if result == ReviewResult.REJECTED else "🔄"
-        self.log(f"{emoji} Score: {score}/10 - {result.value}")
+        self.log("%s Score: %s/10 - %s", emoji, score, result.value)
 
         return SupervisorFeedback(
             result=result,
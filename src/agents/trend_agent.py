@@ -5,11 +5,11 @@
 import random
 from typing import Optional
 
-import httpx
 from langchain_core.prompts import ChatPromptTemplate
 
-from ..config import settings
+from ..config import get_settings
 from ..models import ContentType, TrendData
+from ._http import get_http_client
 from .base import BaseAgent
 
 # 쇼츠에서 잘 먹히는 카테고리
@@ -36,8 +36,9 @@ class TrendAgent(BaseAgent[list[TrendData]]):
 
     def __init__(self):
         super().__init__()
-        self.api_key = settings.youtube.api_key
-        self.region = settings.youtube.region_code
+        youtube = get_settings().youtube
+        self.api_key = youtube.api_key
+        self.region = youtube.region_code
 
     async def run(
         self,
@@ -57,7 +58,7 @@ class TrendAgent(BaseAgent[list[TrendData]]):
 
         # 직접 주제 입력한 경우
         if topic:
-            self.log(f"Using custom topic: {topic}")
+            self.log("Using custom topic: %s", topic)
             return [
                 TrendData(
                     title=topic,
@@ -72,7 +73,7 @@ class TrendAgent(BaseAgent[list[TrendData]]):
         if not category:
             category = random.choice(VIRAL_CATEGORIES)
 
-        self.log(f"Generating viral topics for category: {category}")
+        self.log("Generating viral topics for category: %s", category)
 
         # YouTube 트렌드 참고 (API 있으면)
         youtube_context = ""
@@ -85,7 +86,7 @@ class TrendAgent(BaseAgent[list[TrendData]]):
         topics = await self._generate_viral_topics(category, limit,
                                                    youtube_context)
 
-        self.log(f"Generated {len(topics)} viral topics")
+        self.log("Generated %s viral topics", len(topics))
         return topics
 
     async def _generate_viral_topics(
@@ -137,17 +138,17 @@ class TrendAgent(BaseAgent[list[TrendData]]):
                 "youtube_context": youtube_context,
                 "limit": limit,
             })
-            self.log(f"LLM Response received: {len(response.content)} chars")
-            self.log(f"Response preview: {response.content[:200]}...")
+            self.log("LLM Response received: %s chars", len(response.content))
+            self.log("Response preview: %.200s...", response.content)
 
             # 파싱
             topics = self._parse_topics(response.content, category)
-            self.log(f"Parsed {len(topics)} topics")
+            self.log("Parsed %s topics", len(topics))
             return topics[:limit]
         except Exception as e:
             import traceback
-            self.log(f"LLM Error: {type(e).__name__}: {e}")
-            self.log(traceback.format_exc())
+            self.warn("LLM Error: %s: %s", type(e).__name__, e)
+            self.warn(traceback.format_exc())
             return []
 
     def _parse_topics(self, response: str, category: str) -> list[TrendData]:
@@ -221,24 +222,23 @@ class TrendAgent(BaseAgent[list[TrendData]]):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    f"{self.API_BASE}/videos",
-                    params=params,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await get_http_client().get(
+                f"{self.API_BASE}/videos",
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-                keywords = []
-                for item in data.get("items", []):
-                    title = item.get("snippet", {}).get("title", "")
-                    # 간단히 제목에서 키워드 추출
-                    keywords.append(title[:30])
+            keywords = []
+            for item in data.get("items", []):
+                title = item.get("snippet", {}).get("title", "")
+                # 간단히 제목에서 키워드 추출
+                keywords.append(title[:30])
 
-                return keywords
+            return keywords
 
         except Exception as e:
-            self.log(f"YouTube API error (ignored): {e}")
+            self.warn("YouTube API error (ignored): %s", e)
             return []
 
     async def search_youtube(self,
@@ -259,32 +259,31 @@ class TrendAgent(BaseAgent[list[TrendData]]):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    f"{self.API_BASE}/search",
-                    params=params,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                trends = []
-                for item in data.get("items", []):
-                    snippet = item.get("snippet", {})
-                    video_id = item.get("id", {}).get("videoId", "")
-
-                    trends.append(
-                        TrendData(
-                            title=snippet.get("title", ""),
-                            source=
-                            f"YouTube ({snippet.get('channelTitle', '')})",
-                            url=f"https://youtube.com/watch?v={video_id}",
-                            score=0,
-                            content=snippet.get("description", ""),
-                            content_type=ContentType.YOUTUBE_SEARCH,
-                        ))
-
-                return trends
+            response = await get_http_client().get(
+                f"{self.API_BASE}/search",
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            trends = []
+            for item in data.get("items", []):
+                snippet = item.get("snippet", {})
+                video_id = item.get("id", {}).get("videoId", "")
+
+                trends.append(
+                    TrendData(
+                        title=snippet.get("title", ""),
+                        source=
+                        f"YouTube ({snippet.get('channelTitle', '')})",
+                        url=f"https://youtube.com/watch?v={video_id}",
+                        score=0,
+                        content=snippet.get("description", ""),
+                        content_type=ContentType.YOUTUBE_SEARCH,
+                    ))
+
+            return trends
 
         except Exception as e:
-            self.log(f"YouTube search error: {e}")
+            self.warn("YouTube search error: %s", e)
             return []
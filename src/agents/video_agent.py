@@ -3,25 +3,66 @@
 """
 
 import asyncio
+import bisect
+import functools
+import os
+import re
+import subprocess
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 from pathlib import Path
 
 from moviepy import (
     AudioFileClip,
     ColorClip,
-    CompositeAudioClip,
     CompositeVideoClip,
-    ImageClip,
     TextClip,
-    concatenate_videoclips,
+    VideoClip,
 )
-from moviepy.audio.fx import MultiplyVolume
+from moviepy.config import FFMPEG_BINARY
+import numpy as np
 from PIL import Image
 import random
 
-from ..config import settings
 from ..models import AudioResult, ImageResult, Script, VideoResult
+from ._video_common import (
+    BG_COLOR,
+    FONT_PATH,
+    HEIGHT,
+    WIDTH,
+    render_subtitle_tile,
+)
 from .base import BaseAgent
 
+# 자막 전처리용 정규식 (모듈 로드 시 한 번만 컴파일)
+_SENT_SPLIT_RE = re.compile(r'(?<=[.?!])\s+')  # 마침표/물음표/느낌표 뒤에서 분리
+_QUOTES_RE = re.compile('["\'\u2018\u2019\u201C\u201D]')  # 따옴표 제거
+_LONG_WORD_RE = re.compile(r'\S{6,}')  # 6글자 이상 단어
+# 구절 분리: 단어 2개/3개씩 (공백은 미리 한 칸으로 정리된 상태)
+_PHRASE_RES = {n: re.compile(r'\S+(?: \S+){0,%d}' % (n - 1)) for n in (2, 3)}
+
+
+@functools.lru_cache(maxsize=1)
+def _nvenc_available() -> bool:
+    """h264_nvenc 인코더 사용 가능 여부 (프로세스당 한 번만 확인)
+
+    ffmpeg 빌드에 포함돼 있어도 GPU/드라이버가 없으면 실패하므로
+    짧은 테스트 인코딩으로 확인
+    """
+    try:
+        result = subprocess.run(
+            [
+                FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-f",
+                "lavfi", "-i", "color=c=black:s=256x256:d=0.1", "-c:v",
+                "h264_nvenc", "-f", "null", "-"
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
 
 class VideoAgent(BaseAgent[VideoResult]):
     """Agent for creating short videos with images and subtitles"""
@@ -30,9 +71,10 @@ class VideoAgent(BaseAgent[VideoResult]):
     def name(self) -> str:
         return "🎬 VideoAgent"
 
-    # Short video dimensions (9:16 aspect ratio)
-    WIDTH = 1080
-    HEIGHT = 1920
+    # Short video dimensions (9:16 aspect ratio) - _video_common 공통 상수
+    WIDTH = WIDTH
+    HEIGHT = HEIGHT
+    FPS = 30
 
     # BGM 폴더 경로
     BGM_DIR = Path(__file__).parent.parent.parent / "assets" / "bgm"
@@ -51,50 +93,32 @@ class VideoAgent(BaseAgent[VideoResult]):
             script: Script,
             output_path: Path,
             title: str = None,  # 상단 제목 (선택)
+            slides: list[np.ndarray] | None = None,  # prepare_background 결과
     ) -> VideoResult:
-        """Create final short video with images and subtitles"""
+        """Create final short video with images and subtitles
+
+        slides를 넘기면 (prepare_background로 미리 래스터화한 장면)
+        이미지 디코딩/리사이즈 없이 바로 합성
+        """
         self.log("Creating video...")
 
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load TTS audio
+        # TTS 길이만 확인 (오디오 믹스는 ffmpeg에서)
         tts_clip = AudioFileClip(str(audio.file_path))
         duration = tts_clip.duration
-
-        # Load BGM (있으면 TTS와 믹스)
-        bgm_path = self._get_bgm()
-        if bgm_path:
-            self.log(f"🎵 BGM: {bgm_path.name}")
-            bgm_clip = AudioFileClip(str(bgm_path))
-            # BGM을 영상 길이에 맞게 자르기
-            if bgm_clip.duration > duration:
-                bgm_clip = bgm_clip.subclipped(0, duration)
-            else:
-                # BGM이 짧으면 루프
-                from moviepy import concatenate_audioclips
-                loops_needed = int(duration / bgm_clip.duration) + 1
-                bgm_clips = [
-                    AudioFileClip(str(bgm_path)) for _ in range(loops_needed)
-                ]
-                bgm_clip = concatenate_audioclips(bgm_clips).subclipped(
-                    0, duration)
-            # BGM 볼륨 낮추기 (TTS가 메인) - 15%
-            bgm_clip = bgm_clip.with_effects([MultiplyVolume(0.15)])
-            # TTS + BGM 믹스
-            audio_clip = CompositeAudioClip([tts_clip, bgm_clip])
-        else:
-            self.log("⚠️ No BGM found in assets/bgm/ folder")
-            audio_clip = tts_clip
+        tts_clip.close()
 
         # Create image slideshow
         if images:
-            bg_clip = self._create_image_slideshow(images, duration)
+            bg_clip = self._create_image_slideshow(images, duration, slides)
         else:
             bg_clip = self._create_gradient_background(duration)
 
-        # Generate subtitles
-        subtitle_clips = await self._generate_subtitles(script, duration)
+        # Generate subtitles (배경 프레임에 바로 덮어쓰기)
+        subtitles = await self._generate_subtitles(script, duration)
+        bg_clip = self._overlay_subtitles(bg_clip, subtitles)
 
         # Generate title (상단에 표시)
         title_clips = []
@@ -102,31 +126,21 @@ class VideoAgent(BaseAgent[VideoResult]):
             title_clips = self._create_title_clip(title, duration)
 
         # Compose final video
-        final_clip = CompositeVideoClip([bg_clip] + title_clips +
-                                        subtitle_clips,
+        final_clip = CompositeVideoClip([bg_clip] + title_clips,
                                         size=(self.WIDTH, self.HEIGHT))
-        final_clip = final_clip.with_audio(audio_clip)
 
-        self.log(f"Audio duration: {audio_clip.duration:.1f}s")
+        self.log("Audio duration: %.1fs", duration)
 
-        # Export
-        self.log(f"Exporting video to {output_path}...")
-        final_clip.write_videofile(
-            str(output_path),
-            fps=30,
-            codec="libx264",
-            audio_codec="aac",
-            preset="medium",
-            threads=4,
-            audio=True,  # 오디오 포함 명시
-        )
+        # Export (프레임을 ffmpeg stdin으로 바로 전송, 이벤트 루프는 막지 않음)
+        self.log("Exporting video to %s...", output_path)
+        await asyncio.to_thread(self._export, final_clip,
+                                Path(audio.file_path), output_path)
 
         # Cleanup
-        audio_clip.close()
         bg_clip.close()
         final_clip.close()
 
-        self.log(f"Video created: {output_path}")
+        self.log("Video created: %s", output_path)
 
         return VideoResult(
             file_path=output_path,
@@ -134,127 +148,284 @@ class VideoAgent(BaseAgent[VideoResult]):
             resolution=(self.WIDTH, self.HEIGHT),
         )
 
-    def _create_image_slideshow(
-        self,
-        images: list[ImageResult],
-        duration: float,
-    ) -> CompositeVideoClip:
-        """Create dynamic slideshow with intentional camera effects"""
-        if not images:
-            return self._create_gradient_background(duration)
+    def _select_encoder(self) -> list[str]:
+        """비디오 인코더 인자 - NVENC 가능하면 GPU, 아니면 x264"""
+        if _nvenc_available():
+            return ["-c:v", "h264_nvenc", "-preset", "p4", "-b:v", "6M"]
+        return ["-c:v", "libx264", "-preset", "veryfast"]
 
-        time_per_image = duration / len(images)
-        image_clips = []
+    def _export(self, clip: VideoClip, tts_path: Path,
+                output_path: Path) -> None:
+        """raw RGB 프레임을 ffmpeg 파이프로 인코딩
+
+        TTS + BGM 믹스도 같은 ffmpeg 안에서 처리 (BGM은 무한 루프,
+        TTS 길이에서 끊김) → MoviePy 오디오 디코딩/재인코딩 없음
+        """
+        cmd = [
+            FFMPEG_BINARY, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-s", f"{self.WIDTH}x{self.HEIGHT}", "-r", str(self.FPS),
+            "-i", "-",
+            "-i", str(tts_path),
+        ]
 
-        for i, img_result in enumerate(images):
-            img_path = img_result.file_path
+        # Load BGM (있으면 TTS와 믹스)
+        bgm_path = self._get_bgm()
+        if bgm_path:
+            self.log("🎵 BGM: %s", bgm_path.name)
+            # BGM 볼륨 낮추기 (TTS가 메인) - 15%
+            cmd += [
+                "-stream_loop", "-1", "-i", str(bgm_path),
+                "-filter_complex",
+                "[2:a]volume=0.15[bgm];"
+                "[1:a][bgm]amix=inputs=2:duration=first:normalize=0[aout]",
+                "-map", "0:v", "-map", "[aout]",
+            ]
+        else:
+            self.warn("⚠️ No BGM found in assets/bgm/ folder")
+            cmd += ["-map", "0:v", "-map", "1:a"]
+
+        encoder = self._select_encoder()
+        self.log("Encoder: %s", encoder[1])
+        cmd += encoder + [
+            # RGB → YUV 변환은 ffmpeg 안에서 딱 한 번만 (yuv420p 고정)
+            "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            "-shortest",
+            "-movflags", "+faststart",
+            str(output_path),
+        ]
+
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                stderr=subprocess.PIPE)
+        # stderr는 별도 스레드에서 계속 비움 (에러 출력이 파이프 버퍼를
+        # 넘어도 ffmpeg와 프레임 쓰기가 서로 막히지 않게)
+        stderr_chunks: list[bytes] = []
+        drain = threading.Thread(
+            target=lambda: stderr_chunks.append(proc.stderr.read()),
+            daemon=True)
+        drain.start()
+        try:
+            try:
+                for frame in clip.iter_frames(fps=self.FPS, dtype="uint8"):
+                    proc.stdin.write(memoryview(np.ascontiguousarray(frame)))
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # ffmpeg가 먼저 종료됨 → 아래에서 에러 메시지 확인
+            proc.wait()
+        except BaseException:
+            # 프레임 생성 실패/취소 → ffmpeg 정리하고 잘린 mp4는 남기지 않음
+            proc.kill()
+            proc.wait()
+            output_path.unlink(missing_ok=True)
+            raise
+        finally:
+            drain.join()
+
+        if proc.returncode != 0:
+            output_path.unlink(missing_ok=True)
+            stderr = b"".join(stderr_chunks).decode(errors="ignore")
+            raise RuntimeError(f"ffmpeg export failed: {stderr}")
+
+    def prepare_background(
+        self,
+        images: list[ImageResult],
+        cancel: threading.Event | None = None,
+    ) -> asyncio.Task:
+        """장면 이미지 래스터화를 백그라운드 스레드에서 시작
 
-            # Load image
-            img_clip = ImageClip(str(img_path))
-            img_clip = self._resize_to_fit(img_clip)
+        TTS 생성(네트워크 대기) 동안 CPU로 미리 처리해두고,
+        결과(list[np.ndarray])는 run(slides=...)에 그대로 전달.
+        Task 취소로는 스레드가 안 멈추므로 중단은 cancel 이벤트로
+        """
+        return asyncio.create_task(
+            asyncio.to_thread(self._rasterize_all, images, cancel))
 
-            # 프롬프트에서 카메라 효과 추출 (format: "effect|prompt")
-            effect_type = "static"
-            if "|" in img_result.prompt:
-                parts = img_result.prompt.split("|", 1)
-                effect_type = parts[0].strip()
+    def _rasterize_all(
+        self,
+        images: list[ImageResult],
+        cancel: threading.Event | None = None,
+    ) -> list[np.ndarray]:
+        """모든 장면을 최종 합성용 배열로 변환 (장면별로 병렬)
 
-            # 유효한 효과인지 확인 (shake 제외 - 어지러움)
-            valid_effects = ["zoom_in", "zoom_out", "static", "fade"]
-            if effect_type not in valid_effects:
-                effect_type = "static"
+        PIL 디코딩/리사이즈는 GIL을 풀고 돌기 때문에 스레드로 충분히
+        병렬화됨 (프로세스 풀은 배열 pickling 비용만 추가).
+        cancel이 set되면 아직 시작 안 한 장면은 건너뛰고 CancelledError
+        """
 
-            # 줌/팬 효과 적용
-            img_clip = self._apply_dynamic_effect(img_clip, effect_type,
-                                                  time_per_image)
+        def rasterize(img_result: ImageResult) -> np.ndarray:
+            if cancel is not None and cancel.is_set():
+                raise CancelledError
+            return self._rasterize_slide(img_result)
+
+        self.log("Rasterizing %s slides...", len(images))
+        if len(images) <= 1:
+            return [rasterize(img_result) for img_result in images]
+        workers = min(len(images), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(rasterize, images))
+
+    def _rasterize_slide(self, img_result: ImageResult) -> np.ndarray:
+        """장면 1개 디코딩 → 화면 꽉 채우게 리사이즈 (줌 없는 장면은 크롭까지)"""
+        # 디코딩 → 리사이즈는 PIL 안에서 끝내고 배열 변환은 한 번만
+        slide = self._resize_to_fit(self._load_image(img_result.file_path))
+        if self._parse_effect(img_result.prompt) not in ("zoom_in",
+                                                         "zoom_out"):
+            # 줌 없는 장면은 최종 1080x1920 화면으로 미리 잘라둠
+            # → 프레임마다 크롭/복사 없이 같은 버퍼를 그대로 사용
+            slide = self._crop_center(slide)
+        return np.asarray(slide)
 
-            # Set timing
-            img_clip = img_clip.with_start(i * time_per_image)
-            img_clip = img_clip.with_duration(time_per_image)
+    def _create_image_slideshow(
+        self,
+        images: list[ImageResult],
+        duration: float,
+        slides: list[np.ndarray] | None = None,
+    ) -> VideoClip:
+        """Create dynamic slideshow with intentional camera effects
 
-            image_clips.append(img_clip)
+        프레임 함수 방식: 미리 래스터화된 slides가 없으면
+        현재 시각에 보이는 이미지만 그때그때 디코딩
+        (전체 이미지를 미리 메모리에 올리지 않음)
+        """
+        if not images:
+            return self._create_gradient_background(duration)
 
-        # Create background
-        bg = ColorClip(
-            size=(self.WIDTH, self.HEIGHT),
-            color=(15, 15, 20),
-            duration=duration,
-        )
+        time_per_image = duration / len(images)
+        effects = [
+            self._parse_effect(img_result.prompt) for img_result in images
+        ]
 
-        return CompositeVideoClip([bg] + image_clips,
-                                  size=(self.WIDTH, self.HEIGHT))
+        if slides is not None:
+            load_slide = slides.__getitem__
+        else:
+            # 렌더링은 시간순으로 진행되므로 현재/직전 이미지만 캐시하면 충분
+            load_slide = functools.lru_cache(maxsize=2)(
+                lambda idx: self._rasterize_slide(images[idx]))
+
+        def frame_function(t: float) -> np.ndarray:
+            idx = min(int(t / time_per_image), len(images) - 1)
+            local_t = t - idx * time_per_image
+            return self._apply_dynamic_effect(load_slide(idx), effects[idx],
+                                              local_t, time_per_image)
+
+        return VideoClip(frame_function=frame_function, duration=duration)
+
+    def _parse_effect(self, prompt: str) -> str:
+        """프롬프트에서 카메라 효과 추출 (format: "effect|prompt")"""
+        effect_type = "static"
+        if "|" in prompt:
+            effect_type = prompt.split("|", 1)[0].strip()
+
+        # 유효한 효과인지 확인 (shake 제외 - 어지러움)
+        valid_effects = ["zoom_in", "zoom_out", "static", "fade"]
+        if effect_type not in valid_effects:
+            effect_type = "static"
+        return effect_type
 
     def _apply_dynamic_effect(
         self,
-        clip: ImageClip,
+        slide: np.ndarray,
         effect_type: str,
+        t: float,
         duration: float,
-    ) -> ImageClip:
+    ) -> np.ndarray:
         """
-        다이나믹 효과 적용
+        다이나믹 효과 적용 (구간 내 시각 t의 프레임 반환)
         - zoom_in: 천천히 줌인 (강조)
         - zoom_out: 줌아웃 (전체 상황)
-        - shake: 화면 흔들림 (충격, 놀람)
         - fade: 페이드 효과 (장면 전환)
         - static: 효과 없음
         """
-        import math
-
         # 줌 범위 (1.0 = 원본, 1.15 = 15% 확대)
         zoom_start = 1.0
         zoom_end = 1.15
 
-        def zoom_in_effect(t):
-            """시간에 따라 줌인"""
-            progress = t / duration if duration > 0 else 0
-            scale = zoom_start + (zoom_end - zoom_start) * progress
-            return scale
-
-        def zoom_out_effect(t):
-            """시간에 따라 줌아웃"""
-            progress = t / duration if duration > 0 else 0
-            scale = zoom_end - (zoom_end - zoom_start) * progress
-            return scale
-
-        def shake_position(t):
-            """화면 흔들림 효과"""
-            intensity = 8  # 흔들림 강도 (픽셀)
-            frequency = 15  # 흔들림 빈도
-            x = int(math.sin(t * frequency) * intensity)
-            y = int(math.cos(t * frequency * 1.3) * intensity * 0.5)
-            return (x, y)
+        progress = t / duration if duration > 0 else 0
 
         if effect_type == "zoom_in":
-            return clip.resized(lambda t: zoom_in_effect(t))
+            # 시간에 따라 줌인
+            zoom = zoom_start + (zoom_end - zoom_start) * progress
         elif effect_type == "zoom_out":
-            return clip.resized(lambda t: zoom_out_effect(t))
-        elif effect_type == "shake":
-            # 흔들림 + 살짝 줌인
-            clip = clip.resized(1.05)
-            return clip.with_position(shake_position)
-        elif effect_type == "fade":
-            # 페이드인 효과
-            return clip.with_effects([lambda c: c.crossfadein(0.3)])
+            # 시간에 따라 줌아웃
+            zoom = zoom_end - (zoom_end - zoom_start) * progress
         else:
-            return clip
-
-    def _resize_to_fit(self, clip: ImageClip) -> ImageClip:
-        """Resize image clip to fit 9:16 - 화면 꽉 채우고 위아래 크롭"""
-        # 화면을 꽉 채우고 2배 확대
-        scale_w = self.WIDTH / clip.w
-        scale_h = self.HEIGHT / clip.h
-        scale = max(scale_w, scale_h) * 2.0  # 2배 확대
-
-        new_w = int(clip.w * scale)
-        new_h = int(clip.h * scale)
-
-        clip = clip.resized((new_w, new_h))
-
-        # 중앙 배치 (화면 꽉 채움)
-        x_pos = (self.WIDTH - new_w) // 2
-        y_pos = (self.HEIGHT - new_h) // 2
-
-        return clip.with_position((x_pos, y_pos))
+            zoom = 1.0
+
+        slide_h, slide_w = slide.shape[:2]
+        # 화면에 보일 영역 (중앙 기준, 줌만큼 좁아짐)
+        crop_w = self.WIDTH / zoom
+        crop_h = self.HEIGHT / zoom
+        left = (slide_w - crop_w) / 2
+        top = (slide_h - crop_h) / 2
+
+        if zoom == 1.0:
+            if (slide_w, slide_h) == (self.WIDTH, self.HEIGHT):
+                # 미리 래스터화된 장면 (읽기 전용 버퍼 그대로)
+                frame = slide
+            else:
+                x, y = int(left), int(top)
+                frame = np.ascontiguousarray(
+                    slide[y:y + self.HEIGHT, x:x + self.WIDTH])
+        else:
+            # 크롭 + 리사이즈를 한 번에 (box 인자)
+            frame = np.asarray(
+                Image.fromarray(slide).resize(
+                    (self.WIDTH, self.HEIGHT),
+                    Image.Resampling.BILINEAR,
+                    box=(left, top, left + crop_w, top + crop_h),
+                ))
+
+        if effect_type == "fade" and t < 0.3:
+            # 페이드인: 배경색에서 0.3초 동안 이미지로 전환
+            alpha = t / 0.3
+            bg = np.array(BG_COLOR, dtype=np.float32)
+            frame = (bg + (frame - bg) * alpha).astype(np.uint8)
+
+        return frame
+
+    def _load_image(self, img_path: Path) -> Image.Image:
+        """이미지를 RGB로 한 번만 디코딩
+
+        JPEG는 draft 모드로 DCT 단계에서 미리 축소해서 디코딩
+        (화면보다 훨씬 큰 사진일 때 디코딩량이 크게 줄어듦, PNG 등은 영향 없음)
+        """
+        with Image.open(img_path) as img:
+            img.draft("RGB", (self.WIDTH, self.HEIGHT))
+            return img.convert("RGB")
+
+    def _resize_to_fit(self, image: Image.Image) -> Image.Image:
+        """Resize image to fit 9:16 - 화면 꽉 채우는 크기로 (크롭은 프레임마다)"""
+        # 화면을 딱 맞게 꽉 채움 (추가 확대 없음)
+        # 줌 효과는 중앙을 1.0배에서 확대하기만 하므로 여유 영역이 따로 필요 없음
+        img_w, img_h = image.size
+        scale_w = self.WIDTH / img_w
+        scale_h = self.HEIGHT / img_h
+        scale = max(scale_w, scale_h)
+
+        new_w = max(self.WIDTH, round(img_w * scale))
+        new_h = max(self.HEIGHT, round(img_h * scale))
+
+        # ImageAgent 결과물은 이미 1080x1920이라 대부분 리사이즈 생략
+        if (new_w, new_h) == (img_w, img_h):
+            return image
+
+        # 배율이 0.5~2배 안이면 BILINEAR로 충분 (폰 화면에서 차이 없음)
+        if 0.5 <= scale <= 2.0:
+            return image.resize((new_w, new_h), Image.Resampling.BILINEAR)
+
+        # 크게 줄이거나 키울 때만 LANCZOS (축소 시 reduce로 먼저 정수배 축소)
+        return image.resize((new_w, new_h), Image.Resampling.LANCZOS,
+                            reducing_gap=3.0)
+
+    def _crop_center(self, image: Image.Image) -> Image.Image:
+        """화면 크기(1080x1920)로 중앙 크롭"""
+        img_w, img_h = image.size
+        if (img_w, img_h) == (self.WIDTH, self.HEIGHT):
+            return image
+        left = (img_w - self.WIDTH) // 2
+        top = (img_h - self.HEIGHT) // 2
+        return image.crop((left, top, left + self.WIDTH, top + self.HEIGHT))
 
     def _create_title_clip(self, title: str, duration: float) -> list:
         """상단에 제목 오버레이 (반투명 배경 + 흰색 글씨)"""
@@ -270,7 +441,7 @@ class VideoAgent(BaseAgent[VideoResult]):
             text=title,
             font_size=48,
             color="white",
-            font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
+            font=FONT_PATH,
             method="caption",
             size=(self.WIDTH - 100, None),
             text_align="center",
@@ -300,9 +471,10 @@ class VideoAgent(BaseAgent[VideoResult]):
         self,
         script: Script,
         duration: float,
-    ) -> list[TextClip]:
+    ) -> list[tuple[float, float, np.ndarray]]:
         """
-        Generate animated subtitle clips - 요즘 쇼츠 스타일
+        Generate subtitle tiles - 요즘 쇼츠 스타일
+        (start, end, 미리 렌더링된 자막 이미지) 목록을 시간순으로 반환
         
         특징:
         - 짧게 짧게 (2-4 단어씩)
@@ -310,41 +482,32 @@ class VideoAgent(BaseAgent[VideoResult]):
         - 하단 safe zone에 배치
         - 큰 글씨 + 테두리 (가독성)
         """
-        subtitle_clips = []
+        subtitles = []
 
         # 스크립트를 문장 단위로 먼저 분리
         text = script.full_text
 
-        # 따옴표 제거 (", ", ‘, ’, “, ” 등)
-        text = text.replace('"', '').replace("'", '')
-        text = text.replace('“', '').replace('”',
-                                             '').replace('‘',
-                                                         '').replace('’', '')
+        # 따옴표 제거 (", ', ‘, ’, “, ” 등) + 공백 한 칸으로 정리
+        text = " ".join(_QUOTES_RE.sub('', text).split())
 
         # 마침표, 물음표, 느낌표로 문장 분리
-        import re
-        sentences = re.split(r'(?<=[.?!])\s+', text)
+        sentences = _SENT_SPLIT_RE.split(text)
 
-        # 각 문장을 짧은 구절로 분리 (2-4 단어)
+        # 각 문장을 짧은 구절로 분리 (정규식 한 번으로 2-3 단어씩)
         phrases = []
         for sentence in sentences:
-            words = sentence.split()
-
             # 한국어 특성상 2-3 단어가 적당 (긴 단어 많음)
-            chunk_size = 2 if any(len(w) > 5 for w in words) else 3
-
-            for i in range(0, len(words), chunk_size):
-                chunk = words[i:i + chunk_size]
-                if chunk:
-                    phrase = " ".join(chunk)
-                    # 너무 짧은 구절은 다음과 합치기
-                    if phrases and len(phrase) < 4 and len(phrases[-1]) < 15:
-                        phrases[-1] += " " + phrase
-                    else:
-                        phrases.append(phrase)
+            chunk_size = 2 if _LONG_WORD_RE.search(sentence) else 3
+
+            for phrase in _PHRASE_RES[chunk_size].findall(sentence):
+                # 너무 짧은 구절은 다음과 합치기
+                if phrases and len(phrase) < 4 and len(phrases[-1]) < 15:
+                    phrases[-1] += " " + phrase
+                else:
+                    phrases.append(phrase)
 
         if not phrases:
-            return subtitle_clips
+            return subtitles
 
         # 각 구절의 표시 시간 계산
         # 최소 0.4초, 최대 1.5초 (글자수에 비례)
@@ -373,50 +536,56 @@ class VideoAgent(BaseAgent[VideoResult]):
                 pt["start"] *= scale
                 pt["duration"] *= scale
 
-        self.log(f"Creating {len(phrases)} subtitle segments")
+        self.log("Creating %s subtitle segments", len(phrases))
 
         for pt in phrase_times:
-            # 자막 텍스트 클립 생성 (두꺼운 글씨 + 테두리)
-            txt_clip = TextClip(
-                text=pt["text"],
-                font_size=72,  # 더 큰 글씨
-                color="white",
-                font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
-                method="caption",
-                size=(self.WIDTH - 160, None),
-                text_align="center",
-                stroke_color="black",  # 검정 테두리
-                stroke_width=3,  # 테두리 두께
-            )
-
-            # 검정색 배경 박스 생성 (더 크게)
-            txt_w, txt_h = txt_clip.size
-            padding_x = 40  # 좌우 패딩
-            padding_y = 30  # 상하 패딩
-            bg_clip = ColorClip(
-                size=(txt_w + padding_x * 2, txt_h + padding_y * 2),
-                color=(0, 0, 0),  # 검정색
-            )
-
-            # 배경 + 텍스트 합치기
-            bg_clip = bg_clip.with_position(("center", self.HEIGHT * 0.72))
-            txt_clip = txt_clip.with_position(
-                ("center", self.HEIGHT * 0.72 + padding_y))
-
-            bg_clip = bg_clip.with_start(pt["start"]).with_duration(
-                pt["duration"])
-            txt_clip = txt_clip.with_start(pt["start"]).with_duration(
-                pt["duration"])
-
-            subtitle_clips.append(bg_clip)
-            subtitle_clips.append(txt_clip)
-
-        return subtitle_clips
+            # 배경 박스 + 텍스트를 한 장의 이미지로 미리 렌더링
+            tile = render_subtitle_tile(pt["text"])
+            subtitles.append(
+                (pt["start"], pt["start"] + pt["duration"], tile))
+
+        return subtitles
+
+    def _overlay_subtitles(
+        self,
+        clip: VideoClip,
+        subtitles: list[tuple[float, float, np.ndarray]],
+    ) -> VideoClip:
+        """배경 프레임을 만들 때 현재 자막 타일을 바로 덮어쓰기
+
+        자막마다 클립을 만들어 합성하지 않고, 프레임당 이진 탐색 1번 +
+        numpy 슬라이스 대입 1번으로 끝냄 (타일이 불투명이라 블렌딩 불필요)
+        """
+        if not subtitles:
+            return clip
+
+        starts = [start for start, _, _ in subtitles]
+        y = int(self.HEIGHT * 0.72)
+
+        def with_subtitle(get_frame, t: float) -> np.ndarray:
+            frame = get_frame(t)
+            idx = bisect.bisect_right(starts, t) - 1
+            if idx < 0:
+                return frame
+            _, end, tile = subtitles[idx]
+            if t >= end:
+                return frame
+
+            tile = tile[:self.HEIGHT - y]
+            tile_h, tile_w = tile.shape[:2]
+            x = (self.WIDTH - tile_w) // 2
+
+            # 캐시된 (읽기 전용) 슬라이드 버퍼는 건드리지 않도록 복사 후 대입
+            frame = frame.copy()
+            frame[y:y + tile_h, x:x + tile_w] = tile
+            return frame
+
+        return clip.transform(with_subtitle)
 
     def _create_gradient_background(self, duration: float) -> ColorClip:
         """Create a simple dark background"""
         return ColorClip(
             size=(self.WIDTH, self.HEIGHT),
-            color=(15, 15, 20),
+            color=BG_COLOR,
             duration=duration,
         )
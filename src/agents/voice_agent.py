@@ -4,13 +4,15 @@
 """
 
 import random
+from collections import defaultdict
 from pathlib import Path
 from typing import Literal
 
 import httpx
 
-from ..config import settings
+from ..config import get_settings
 from ..models import AudioResult, Script
+from ._http import get_http_client
 from .base import BaseAgent
 
 # 콘텐츠 톤별 목소리 매핑
@@ -37,6 +39,7 @@ class VoiceAgent(BaseAgent[AudioResult]):
 
     # 새 개인용 API 엔드포인트
     API_BASE = "https://api.typecast.ai"
+    CHUNK_SIZE = 64 * 1024  # 스트리밍 다운로드 청크 크기
 
     @property
     def name(self) -> str:
@@ -44,7 +47,7 @@ class VoiceAgent(BaseAgent[AudioResult]):
 
     def __init__(self):
         super().__init__()
-        self.api_key = settings.tts.typecast_api_key
+        self.api_key = get_settings().tts.typecast_api_key
         self.headers = {
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json",
@@ -52,6 +55,10 @@ class VoiceAgent(BaseAgent[AudioResult]):
 
         # 캐시된 목소리 목록
         self._voices_cache: list[dict] = []
+        # 톤 매칭용 인덱스 (목소리 목록 받을 때 한 번만 구성)
+        self._by_ga: dict[tuple, list[dict]] = {}  # (성별, 연령대)
+        self._by_ga_tiktok: dict[tuple, list[dict]] = {}  # 위 + TikTok/Reels
+        self._by_g: dict[str, list[dict]] = {}  # 성별
 
     async def run(
             self,
@@ -84,25 +91,24 @@ class VoiceAgent(BaseAgent[AudioResult]):
 
         if voice_id:
             # voice_id 직접 지정
-            self.log(f"Using voice_id: {voice_id}")
+            self.log("Using voice_id: %s", voice_id)
         elif voice_name:
             # 이름으로 찾기 (캐시 필요)
             if not self._voices_cache:
-                self._voices_cache = await self.list_voices()
+                await self._load_voices()
             voice_info = self._find_voice_by_name(voice_name)
             voice_id = voice_info["voice_id"]
-            self.log(f"Using voice: {voice_info.get('voice_name', voice_id)}")
+            self.log("Using voice: %s", voice_info.get('voice_name', voice_id))
         else:
             # 톤에 맞게 자동 매칭 (캐시 필요)
             if not self._voices_cache:
-                self._voices_cache = await self.list_voices()
+                await self._load_voices()
                 if not self._voices_cache:
                     raise ValueError("No TypeCast voices available")
             voice_info, emotion = self._match_voice_by_tone(tone)
             voice_id = voice_info["voice_id"]
-            self.log(
-                f"Using voice: {voice_info.get('voice_name', voice_id)} (tone: {tone}, emotion: {emotion})"
-            )
+            self.log("Using voice: %s (tone: %s, emotion: %s)",
+                     voice_info.get('voice_name', voice_id), tone, emotion)
 
         # 감정 프롬프트 설정
         if emotion == "smart":
@@ -112,10 +118,13 @@ class VoiceAgent(BaseAgent[AudioResult]):
 
         # TTS 생성
         # 쇼츠는 빠른 템포가 좋음 (1.1~1.2배속)
-        async with httpx.AsyncClient(timeout=120) as client:
-            response = await client.post(
+        # 응답(mp3)은 통째로 메모리에 올리지 않고 받는 대로 파일에 기록
+        async with get_http_client().stream(
+                "POST",
                 f"{self.API_BASE}/v1/text-to-speech",
                 headers=self.headers,
+                # TTS 생성은 오래 걸릴 수 있으니 읽기는 넉넉히, 연결은 빨리 포기
+                timeout=httpx.Timeout(120, connect=5),
                 json={
                     "voice_id": voice_id,
                     "text": script.full_text[:2000],  # Max 2000 chars
@@ -129,17 +138,19 @@ class VoiceAgent(BaseAgent[AudioResult]):
                         "audio_format": "mp3",
                     },
                 },
-            )
+        ) as response:
             response.raise_for_status()
 
+            # 로컬 파일에 64KiB 쓰기는 스레드 왕복보다 빠르므로 바로 기록
             with open(output_path, "wb") as f:
-                f.write(response.content)
+                async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                    f.write(chunk)
 
         # Estimate duration (faster tempo)
         char_count = len(script.full_text.replace(" ", ""))
         duration = char_count / 3.5  # 빠른 템포 반영
 
-        self.log(f"Audio saved: {output_path} (~{duration:.1f}s)")
+        self.log("Audio saved: %s (~%.1fs)", output_path, duration)
 
         return AudioResult(
             file_path=output_path,
@@ -147,32 +158,35 @@ class VoiceAgent(BaseAgent[AudioResult]):
             voice_id=voice_id,
         )
 
+    async def _load_voices(self) -> None:
+        """목소리 목록 캐시 + 톤 매칭용 인덱스 구성"""
+        self._voices_cache = await self.list_voices()
+
+        by_ga = defaultdict(list)
+        by_ga_tiktok = defaultdict(list)
+        by_g = defaultdict(list)
+        for v in self._voices_cache:
+            key = (v.get("gender"), v.get("age"))
+            by_ga[key].append(v)
+            if "Tiktok/Reels" in v.get("use_cases", []):
+                by_ga_tiktok[key].append(v)
+            by_g[v.get("gender")].append(v)
+
+        self._by_ga = dict(by_ga)
+        self._by_ga_tiktok = dict(by_ga_tiktok)
+        self._by_g = dict(by_g)
+
     def _match_voice_by_tone(self, tone: ContentTone) -> tuple[dict, str]:
         """콘텐츠 톤에 맞는 목소리 자동 매칭 (다양성을 위해 랜덤 선택)"""
         gender, age, emotion = TONE_VOICE_MAP.get(tone,
                                                   TONE_VOICE_MAP["default"])
 
-        # 조건에 맞는 목소리 찾기
-        candidates = [
-            v for v in self._voices_cache
-            if v.get("gender") == gender and v.get("age") == age
-        ]
-
-        if candidates:
-            # TikTok/Reels 우선 후보 필터링
-            tiktok_candidates = [
-                v for v in candidates
-                if "Tiktok/Reels" in v.get("use_cases", [])
-            ]
-            if tiktok_candidates:
-                # 랜덤 선택으로 다양성 부여
-                return random.choice(tiktok_candidates), emotion
-            return random.choice(candidates), emotion
-
-        # 조건 완화: 성별만 맞춰서 찾기
-        candidates = [
-            v for v in self._voices_cache if v.get("gender") == gender
-        ]
+        # 조건에 맞는 목소리 찾기 (TikTok/Reels 후보 우선)
+        # 랜덤 선택으로 다양성 부여
+        candidates = (self._by_ga_tiktok.get((gender, age))
+                      or self._by_ga.get((gender, age))
+                      # 조건 완화: 성별만 맞춰서 찾기
+                      or self._by_g.get(gender))
         if candidates:
             return random.choice(candidates), emotion
 
@@ -191,7 +205,7 @@ class VoiceAgent(BaseAgent[AudioResult]):
                 return voice
 
         # 못 찾으면 기본값
-        self.log(f"Voice '{name}' not found, using default")
+        self.warn("Voice '%s' not found, using default", name)
         return self._voices_cache[0]
 
     async def list_voices(self, use_case: str = None) -> list[dict]:
@@ -204,16 +218,15 @@ class VoiceAgent(BaseAgent[AudioResult]):
             if use_case:
                 params["use_cases"] = use_case
 
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    f"{self.API_BASE}/v2/voices",
-                    headers=self.headers,
-                    params=params,
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await get_http_client().get(
+                f"{self.API_BASE}/v2/voices",
+                params=params,
+                headers=self.headers,
+            )
+            response.raise_for_status()
+            return response.json()
         except Exception as e:
-            self.log(f"Error listing voices: {e}")
+            self.warn("Error listing voices: %s", e)
             return []
 
     async def list_voices_for_shorts(self) -> list[dict]:
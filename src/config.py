@@ -2,48 +2,60 @@
 ⚙️ Configuration Management
 """
 
+import functools
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # Load environment variables
 load_dotenv()
 
+# 환경변수 스냅샷 (설정 객체 만들 때마다 os.environ 디코딩 안 하도록)
+_ENV: dict[str, str] = dict(os.environ)
+
+
+def refresh_env_cache() -> None:
+    """.env를 다시 읽고 환경변수 스냅샷 갱신 (이후 생성되는 설정에 반영)"""
+    global _ENV
+    load_dotenv(override=True)
+    _ENV = dict(os.environ)
+    get_settings.cache_clear()
+
 
 class AWSConfig(BaseModel):
     """AWS Bedrock Configuration"""
     access_key_id: str = Field(
-        default_factory=lambda: os.getenv("AWS_ACCESS_KEY_ID", ""))
+        default_factory=lambda: _ENV.get("AWS_ACCESS_KEY_ID", ""))
     secret_access_key: str = Field(
-        default_factory=lambda: os.getenv("AWS_SECRET_ACCESS_KEY", ""))
+        default_factory=lambda: _ENV.get("AWS_SECRET_ACCESS_KEY", ""))
     region: str = Field(
-        default_factory=lambda: os.getenv("AWS_REGION", "ap-northeast-2"))
-    model_id: str = Field(default_factory=lambda: os.getenv(
+        default_factory=lambda: _ENV.get("AWS_REGION", "ap-northeast-2"))
+    model_id: str = Field(default_factory=lambda: _ENV.get(
         "BEDROCK_MODEL_ID", "anthropic.claude-sonnet-4-5-20250929-v1:0"))
 
 
 class TTSConfig(BaseModel):
     """TypeCast TTS Configuration (한국 쇼츠 대중 목소리)"""
     typecast_api_key: str = Field(
-        default_factory=lambda: os.getenv("TYPECAST_API_KEY", ""))
+        default_factory=lambda: _ENV.get("TYPECAST_API_KEY", ""))
     default_voice: str = Field(default="default")
 
 
 class YouTubeConfig(BaseModel):
     """YouTube Data API Configuration"""
     api_key: str = Field(
-        default_factory=lambda: os.getenv("YOUTUBE_API_KEY", ""))
+        default_factory=lambda: _ENV.get("YOUTUBE_API_KEY", ""))
     region_code: str = Field(
-        default_factory=lambda: os.getenv("YOUTUBE_REGION", "KR"))
+        default_factory=lambda: _ENV.get("YOUTUBE_REGION", "KR"))
 
 
 class StableDiffusionConfig(BaseModel):
     """Stable Diffusion (Local) Configuration"""
-    api_url: str = Field(default_factory=lambda: os.getenv(
+    api_url: str = Field(default_factory=lambda: _ENV.get(
         "SD_API_URL", "http://127.0.0.1:7860"))
-    model: str = Field(default_factory=lambda: os.getenv("SD_MODEL", ""))
+    model: str = Field(default_factory=lambda: _ENV.get("SD_MODEL", ""))
 
 
 class Settings(BaseModel):
@@ -56,16 +68,45 @@ class Settings(BaseModel):
 
     # General settings
     output_dir: Path = Field(default_factory=lambda: Path(
-        os.getenv("OUTPUT_DIR",
-                  Path(__file__).parent.parent / "output")))
+        _ENV.get("OUTPUT_DIR",
+                 Path(__file__).parent.parent / "output")))
     default_language: str = Field(
-        default_factory=lambda: os.getenv("DEFAULT_LANGUAGE", "ko"))
+        default_factory=lambda: _ENV.get("DEFAULT_LANGUAGE", "ko"))
+    # 진행 로그 레벨 (배치/서버 실행은 WARNING으로 올리면 단계별 출력 생략)
+    log_level: str = Field(
+        default_factory=lambda: _ENV.get("LOG_LEVEL", "INFO").upper())
+    # 배치 생성 시 동시에 돌릴 쇼츠 수 (API 동시 요청 한도에 맞게)
+    max_parallel: int = Field(
+        default_factory=lambda: int(_ENV.get("MAX_PARALLEL", "2")))
+    # 쇼츠 1개 안에서 동시에 진행할 장면 이미지 수
+    image_concurrency: int = Field(
+        default_factory=lambda: int(_ENV.get("IMAGE_CONCURRENCY", "2")))
+    # 파이프라인 한 번 호출로 같이 생성할 장면 수 (VRAM 여유 있을 때 올리기)
+    image_batch_size: int = Field(
+        default_factory=lambda: int(_ENV.get("IMAGE_BATCH_SIZE", "1")))
+    # 트렌드 결과 디스크 캐시 유지 시간(초), 0이면 끔 (개발 중 반복 실행용)
+    trend_cache_ttl: int = Field(
+        default_factory=lambda: int(_ENV.get("TREND_CACHE_TTL", "0")))
+
+    # 출력 폴더 생성 여부 (프로세스당 mkdir 한 번)
+    _output_dir_ready: bool = PrivateAttr(default=False)
 
     def ensure_output_dir(self) -> Path:
         """Ensure output directory exists"""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not self._output_dir_ready:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dir_ready = True
         return self.output_dir
 
 
-# Global settings instance
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """설정 객체 (처음 필요할 때 한 번만 생성)"""
+    return Settings()
+
+
+def __getattr__(name: str):
+    """`config.settings` 호환 - 접근 시점에 get_settings()로 생성"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,16 +3,19 @@
 """
 
 import asyncio
+import logging
+import sys
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
-from .config import settings
-from .models import ContentType
-from .workflows import ShortsWorkflow
+from .config import get_settings
+
+# 워크플로우(LangGraph, boto3, diffusers/torch 등)는 generate 안에서만 import
+# → config/init 명령은 무거운 의존성 로드 없이 바로 실행
 
 app = typer.Typer(
     name="shorts-automation",
@@ -21,6 +24,18 @@ app = typer.Typer(
 console = Console()
 
 
+def _setup_logging() -> None:
+    """워크플로우/에이전트 진행 로그를 콘솔로 (레벨은 LOG_LEVEL)"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    level = get_settings().log_level
+    for name in ("workflow", "agents"):
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        logger.addHandler(handler)
+        logger.propagate = False
+
+
 @app.command()
 def generate(
     count: int = typer.Option(
@@ -52,13 +67,28 @@ def generate(
         "--strict/--fast",
         help="Strict supervisor mode (default: fast)",
     ),
+    resume: str = typer.Option(
+        None,
+        "--resume",
+        "-r",
+        help="Resume a failed short by its id (e.g. 20260209_143052_a1b2c3)",
+    ),
 ):
     """Generate YouTube Shorts automatically - just run it!"""
+    from .models import ContentType
+    from .workflows import ShortsWorkflow
+
+    _setup_logging()
 
     mode_text = "👨‍💼 STRICT" if strict else "🚀 FAST"
 
     # 주제 소스 결정
-    if topic:
+    if resume:
+        # 이어서 실행은 기존 쇼츠 하나만 (주제는 체크포인트에 저장돼 있음)
+        source = f"이어서 실행: {resume}"
+        content_type = ContentType.AUTO
+        count = 1
+    elif topic:
         source = f"직접입력: {topic[:20]}..."
         content_type = ContentType.CUSTOM
     elif search:
@@ -80,28 +110,57 @@ def generate(
     # Run workflow
     workflow = ShortsWorkflow(strict_mode=strict)
 
-    async def run_batch():
-        results = []
-        for i in range(count):
+    # 동시 실행 수 제한 (Bedrock/TypeCast 요청 한도)
+    settings = get_settings()
+    semaphore = asyncio.Semaphore(max(1, settings.max_parallel))
+
+    async def run_one(i: int):
+        def on_update(node: str, delta: dict) -> None:
+            # 단계가 끝날 때마다 한 줄 (LOG_LEVEL=WARNING이어도 진행 상황은 보임)
+            failed = bool(delta.get("error"))
+            style, mark = ("red", "✗") if failed else ("green", "✓")
+            console.print(
+                Text.assemble((f"  {mark} ", style),
+                              f"short {i+1}/{count} · {node}"))
+
+        async with semaphore:
+            # 마크업 파싱 없이 스타일 구간만 조립 (반복 출력용)
             console.print(
-                f"\n[cyan]━━━ Generating short {i+1}/{count} ━━━[/cyan]")
-            result = await workflow.run(
+                Text.assemble("\n",
+                              (f"━━━ Generating short {i+1}/{count} ━━━",
+                               "cyan")))
+            return await workflow.run(
                 content_type=content_type,
                 category=category,
                 topic=topic,
                 search_query=search,
+                resume_id=resume,
+                on_update=on_update,
+                batch_index=i,
             )
-            results.append(result)
-        return results
+
+    async def run_batch():
+        try:
+            return await asyncio.gather(*(run_one(i) for i in range(count)),
+                                        return_exceptions=True)
+        finally:
+            await workflow.aclose()
 
     results = asyncio.run(run_batch())
 
+    # 실패한 쇼츠는 에러만 출력 (나머지 결과는 유지)
+    for i, r in enumerate(results):
+        if isinstance(r, BaseException):
+            # 에러 메시지에 [..]가 있어도 마크업으로 해석되지 않게 Text 사용
+            console.print(Text(f"❌ Short {i+1} failed: {r}", style="red"))
+
     # Summary
-    successful = [r for r in results if r is not None]
+    successful = sum(1 for r in results
+                     if r is not None and not isinstance(r, BaseException))
     console.print("\n")
     console.print(
         Panel.fit(
-            f"[green]✅ Generated {len(successful)}/{len(results)} shorts![/green]\n"
+            f"[green]✅ Generated {successful}/{len(results)} shorts![/green]\n"
             f"Output directory: {settings.output_dir}",
             title="Complete",
         ))
@@ -110,12 +169,15 @@ def generate(
 @app.command()
 def config():
     """Show current configuration"""
+    settings = get_settings()
     console.print(
         Panel.fit(
             f"[bold]⚙️ Configuration[/bold]\n\n"
             f"Output Dir: {settings.output_dir}\n"
             f"Language: {settings.default_language}\n"
-            f"TTS Voice: {settings.tts.default_voice}\n\n"
+            f"TTS Voice: {settings.tts.default_voice}\n"
+            f"Max Parallel: {settings.max_parallel}\n"
+            f"Log Level: {settings.log_level}\n\n"
             f"[dim]API Keys configured:[/dim]\n"
             f"  AWS Bedrock: {'✅' if settings.aws.access_key_id else '⚡ (CLI)'}\n"
             f"  TypeCast: {'✅' if settings.tts.typecast_api_key else '❌'}\n"
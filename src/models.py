@@ -2,12 +2,14 @@
 📦 Data Models
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass as validated_dataclass
 
 
 class ContentType(str, Enum):
@@ -33,6 +35,9 @@ class ContentTone(str, Enum):
 
 class TrendData(BaseModel):
     """Trending topic data"""
+    # 스키마는 import 시점이 아니라 첫 생성 때 빌드 (config/init 명령은 안 씀)
+    model_config = ConfigDict(defer_build=True)
+
     title: str
     source: str
     url: Optional[str] = None
@@ -51,14 +56,21 @@ class CameraEffect(str, Enum):
     STATIC = "static"  # 정적
 
 
-class SceneInfo(BaseModel):
-    """장면 정보 (프롬프트 + 카메라 효과)"""
+@validated_dataclass(slots=True)
+class SceneInfo:
+    """장면 정보 (프롬프트 + 카메라 효과)
+
+    단순 데이터 묶음이라 slots 데이터클래스 (인스턴스 __dict__ 없음)
+    LLM 응답(dict)에서 만들어지므로 검증은 유지
+    """
     prompt: str
     effect: CameraEffect = CameraEffect.STATIC
 
 
 class Script(BaseModel):
     """Generated script for a short"""
+    model_config = ConfigDict(defer_build=True)
+
     hook: str  # First 3 seconds
     body: str  # Main content
     cta: str  # Call to action
@@ -79,21 +91,25 @@ class Script(BaseModel):
         return self.full_text
 
 
-class ImageResult(BaseModel):
+# 결과 객체는 에이전트가 직접 만드는 값이라 검증 없는 일반 데이터클래스
+@dataclass(slots=True)
+class ImageResult:
     """Generated image result"""
     file_path: Path
     prompt: str
     index: int = 0
 
 
-class AudioResult(BaseModel):
+@dataclass(slots=True)
+class AudioResult:
     """Generated audio result"""
     file_path: Path
     duration: float
     voice_id: str
 
 
-class VideoResult(BaseModel):
+@dataclass(slots=True)
+class VideoResult:
     """Generated video result"""
     file_path: Path
     duration: float
@@ -2,9 +2,22 @@
 🔄 Main Shorts Workflow (with Supervisor Review)
 """
 
-import uuid
-from typing import TypedDict
-
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import date
+from operator import attrgetter
+from pathlib import Path
+from typing import Annotated, Callable, ClassVar, TypedDict
+
+import aiosqlite
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import END, StateGraph
 
 from ..agents import (
@@ -16,23 +29,57 @@ from ..agents import (
     VideoAgent,
     VoiceAgent,
 )
-from ..config import settings
+from ..agents._http import aclose_http_client
+from ..config import get_settings
 from ..models import (
     AudioResult,
+    CameraEffect,
+    ContentTone,
     ContentType,
     ImageResult,
+    SceneInfo,
     Script,
     TrendData,
     VideoResult,
 )
 
+# 진행 로그 (LOG_LEVEL=WARNING이면 메시지 포맷 자체를 건너뜀)
+log = logging.getLogger("workflow")
+
 # 최대 재시도 횟수
 MAX_RETRIES = 3
 
+# 로그 구분선 (단계 헤더/최종 결과)
+_RULE = "─" * 50
+_BAR = "=" * 50
+_BAR60 = "=" * 60
+
+# 문장 끝 기호 (hook 첫 문장을 제목으로 쓸 때)
+_SENTENCE_END = re.compile(r"[.?!]")
+
+
+# 체크포인트에서 복원을 허용할 상태 타입 (등록 안 된 타입은 역직렬화 차단됨)
+_CHECKPOINT_TYPES = [(t.__module__, t.__name__) for t in (
+    ContentType, ContentTone, CameraEffect, TrendData, SceneInfo, Script,
+    ImageResult, AudioResult, VideoResult)]
+
+
+def _first_error(current: str | None, update: str | None) -> str | None:
+    """병렬 노드가 동시에 에러를 내면 먼저 기록된 에러 유지"""
+    return current or update
+
+
+def _error_text(e: BaseException) -> str:
+    """TaskGroup 에러 묶음이면 처음 실패한 원인 메시지만"""
+    while isinstance(e, BaseExceptionGroup):
+        e = e.exceptions[0]
+    return str(e)
+
 
 class WorkflowState(TypedDict):
     """State for the shorts workflow"""
     short_id: str
+    batch_index: int  # 배치 안에서 몇 번째 쇼츠인지 (캐시 후보 분배용)
     content_type: ContentType
     category: str | None
     topic: str | None  # 직접 입력 주제
@@ -40,7 +87,8 @@ class WorkflowState(TypedDict):
 
     # Generated data
     trend: TrendData | None
-    trends_pool: list[TrendData]  # 후보 트렌드들
+    trends_pool: list[TrendData]  # 후보 트렌드들 (받은 뒤엔 그대로 둠)
+    trend_cursor: int  # trends_pool에서 다음에 볼 후보 위치
     script: Script | None
     images: list[ImageResult]
     audio: AudioResult | None
@@ -52,29 +100,75 @@ class WorkflowState(TypedDict):
     image_attempts: int
     audio_attempts: int
 
-    # Error handling
-    error: str | None
+    # Error handling (이미지/오디오 병렬 단계에서 동시에 쓸 수 있음)
+    error: Annotated[str | None, _first_error]
 
 
 class ShortsWorkflow:
     """Main workflow for generating Shorts with Supervisor review"""
 
+    # 에이전트와 컴파일된 그래프는 프로세스 전체에서 공유
+    # (인스턴스마다 다른 건 strict_mode뿐이라 그래프는 모드별로 하나)
+    _agents: ClassVar[tuple | None] = None
+    _graphs: ClassVar[dict[bool, object]] = {}
+
+    # 단계별 체크포인트 저장소 (thread_id = short_id, 실패한 쇼츠 이어서 실행)
+    _checkpointer: ClassVar[AsyncSqliteSaver | None] = None
+
+    # 상태(State)에 넣지 않는 진행 중 작업
+    # (short_id → 배경 래스터화 Task, 래스터화 스레드 중단 이벤트)
+    _bg_tasks: ClassVar[dict[str, tuple[asyncio.Task, threading.Event]]] = {}
+
     def __init__(self, strict_mode: bool = True):
         """
         Args:
             strict_mode: True면 감독이 승인할 때까지 재시도
         """
-        self.trend_agent = TrendAgent()
-        self.script_agent = ScriptAgent()
-        self.image_agent = ImageAgent()
-        self.voice_agent = VoiceAgent()
-        self.video_agent = VideoAgent()
-        self.supervisor = SupervisorAgent()
+        cls = type(self)
+        if cls._agents is None:
+            cls._agents = (
+                TrendAgent(),
+                ScriptAgent(),
+                ImageAgent(),
+                VoiceAgent(),
+                VideoAgent(),
+                SupervisorAgent(),
+            )
+        (self.trend_agent, self.script_agent, self.image_agent,
+         self.voice_agent, self.video_agent, self.supervisor) = cls._agents
 
         self.strict_mode = strict_mode
-        self.graph = self._build_graph()
 
-    def _build_graph(self) -> StateGraph:
+    def _get_graph(self):
+        """모드별 컴파일된 그래프 (첫 실행 때 체크포인터 연결 후 한 번만 컴파일)"""
+        cls = type(self)
+        if cls._checkpointer is None:
+            # 연결은 첫 체크포인트 저장 때 열림 (이벤트 루프 안에서)
+            db_path = get_settings().ensure_output_dir() / "checkpoints.db"
+            cls._checkpointer = AsyncSqliteSaver(
+                aiosqlite.connect(str(db_path)),
+                serde=JsonPlusSerializer(
+                    allowed_msgpack_modules=_CHECKPOINT_TYPES),
+            )
+
+        # 같은 모드의 그래프가 이미 있으면 재사용 (컴파일은 모드별 한 번)
+        if self.strict_mode not in cls._graphs:
+            cls._graphs[self.strict_mode] = self._build_graph(
+                cls._checkpointer)
+        return cls._graphs[self.strict_mode]
+
+    async def aclose(self) -> None:
+        """공용 HTTP 풀/체크포인트 DB 연결 정리 (배치 종료 시 한 번 호출)"""
+        await aclose_http_client()
+
+        cls = type(self)
+        if cls._checkpointer is not None:
+            # 연결을 닫아야 aiosqlite 워커 스레드가 끝나고 프로세스가 종료됨
+            await cls._checkpointer.conn.close()
+            cls._checkpointer = None
+            cls._graphs.clear()
+
+    def _build_graph(self, checkpointer: AsyncSqliteSaver) -> StateGraph:
         """Build the LangGraph workflow"""
         workflow = StateGraph(WorkflowState)
 
@@ -88,15 +182,28 @@ class ShortsWorkflow:
 
         # Add edges
         workflow.add_edge("fetch_trend", "generate_script")
-        workflow.add_edge("generate_script", "generate_images")
-        workflow.add_edge("generate_images", "generate_audio")
-        workflow.add_edge("generate_audio", "final_review")
+        # 대본이 나오면 이미지(SD)와 오디오(TTS)를 동시에 생성
+        # → 둘 다 끝나면 최종 검토로 합류 (대본 실패 시 바로 종료)
+        workflow.add_conditional_edges(
+            "generate_script",
+            self._route_after_script,
+            ["generate_images", "generate_audio", END],
+        )
+        workflow.add_edge(["generate_images", "generate_audio"],
+                          "final_review")
         workflow.add_edge("final_review", "create_video")
         workflow.add_edge("create_video", END)
 
         workflow.set_entry_point("fetch_trend")
 
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
+
+    @staticmethod
+    def _route_after_script(state: WorkflowState) -> list[str] | str:
+        """대본 단계 이후 분기 - 이미지/오디오 병렬 실행 또는 종료"""
+        if state.get("error"):
+            return END
+        return ["generate_images", "generate_audio"]
 
     async def run(
         self,
@@ -104,6 +211,9 @@ class ShortsWorkflow:
         category: str = None,
         topic: str = None,
         search_query: str = None,
+        resume_id: str = None,
+        on_update: Callable[[str, dict], None] | None = None,
+        batch_index: int = 0,
     ) -> VideoResult | None:
         """Run the full workflow
         
@@ -112,19 +222,95 @@ class ShortsWorkflow:
             category: 카테고리 (인간관계, 연애 등)
             topic: 직접 입력 주제
             search_query: YouTube 검색어
+            resume_id: 이전 실행의 short_id - 마지막으로 성공한 단계 다음부터 재실행
+            on_update: 노드가 끝날 때마다 (노드 이름, 변경분)으로 호출 (진행 상황 표시용)
+            batch_index: 배치 실행 시 몇 번째 쇼츠인지 - 캐시된 트렌드 풀을
+                같이 쓸 때 서로 다른 후보부터 보게 함
         """
-        # 날짜시간 형식으로 폴더명 생성 (예: 20260209_143052)
-        from datetime import datetime
-        short_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        graph = self._get_graph()
+
+        if resume_id:
+            short_id = resume_id
+            config = await self._resume_config(graph, resume_id)
+            if config is None:
+                log.error("\n❌ Nothing to resume for %s", resume_id)
+                return None
+            graph_input = None
+            log.info("\n♻️ Resuming %s", resume_id)
+        else:
+            # 날짜시간 형식으로 폴더명 생성 (예: 20260209_143052_a1b2c3)
+            # 동시에 여러 개 돌릴 때 같은 초에 시작해도 겹치지 않게 접미사 추가
+            from datetime import datetime
+            short_id = (f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_"
+                        f"{os.urandom(3).hex()}")
+            config = {"configurable": {"thread_id": short_id}}
+            graph_input = self._initial_state(short_id, batch_index,
+                                              content_type, category, topic,
+                                              search_query)
+
+        mode = "👨‍💼 STRICT" if self.strict_mode else "🚀 FAST"
+        log.info("\n%s\n🎬 SHORTS AUTOMATION (%s MODE)\n%s", _BAR60, mode,
+                 _BAR60)
+
+        try:
+            # 단계별 결과를 끝나는 대로 받음 (마지막 values가 최종 상태)
+            result = {}
+            async for stream_mode, chunk in graph.astream(
+                    graph_input, config, stream_mode=["updates", "values"]):
+                if stream_mode == "values":
+                    result = chunk
+                elif on_update:
+                    for node, delta in chunk.items():
+                        on_update(node, delta or {})
+        finally:
+            # 영상까지 못 가고 끝난 경우 남은 배경 작업 정리
+            self._cancel_bg_task(short_id)
 
-        initial_state: WorkflowState = {
+        if result.get("error"):
+            log.error("\n❌ Workflow failed: %s", result['error'])
+            log.error("   Resume later with: --resume %s", short_id)
+            return None
+
+        # 끝까지 완료된 쇼츠는 이어서 실행할 일이 없으니 체크포인트 삭제
+        # (실패한 쇼츠만 DB에 남아서 파일이 계속 커지지 않음)
+        await type(self)._checkpointer.adelete_thread(short_id)
+        return result.get("video")
+
+    @staticmethod
+    async def _resume_config(graph, short_id: str) -> dict | None:
+        """가장 최근의 에러 없는 체크포인트 (이미 끝난 쇼츠면 None)
+
+        노드는 예외를 잡아서 error로 기록하므로, 에러가 생기기 전
+        마지막 체크포인트에서 다음 단계부터 다시 실행
+        """
+        config = {"configurable": {"thread_id": short_id}}
+        async for snapshot in graph.aget_state_history(config):
+            if not snapshot.values.get("error"):
+                return snapshot.config if snapshot.next else None
+        return None
+
+    @staticmethod
+    def _initial_state(
+        short_id: str,
+        batch_index: int,
+        content_type: ContentType,
+        category: str | None,
+        topic: str | None,
+        search_query: str | None,
+    ) -> WorkflowState:
+        """새 실행의 초기 상태"""
+        get_settings().ensure_output_dir()
+
+        return {
             "short_id": short_id,
+            "batch_index": batch_index,
             "content_type": content_type,
             "category": category,
             "topic": topic,
             "search_query": search_query,
             "trend": None,
             "trends_pool": [],
+            "trend_cursor": 0,
             "script": None,
             "images": [],
             "audio": None,
@@ -136,41 +322,39 @@ class ShortsWorkflow:
             "error": None,
         }
 
-        mode = "👨‍💼 STRICT" if self.strict_mode else "🚀 FAST"
-        print(f"\n{'=' * 60}")
-        print(f"🎬 SHORTS AUTOMATION ({mode} MODE)")
-        print(f"{'=' * 60}")
-
-        result = await self.graph.ainvoke(initial_state)
-
-        if result.get("error"):
-            print(f"\n❌ Workflow failed: {result['error']}")
-            return None
-
-        return result.get("video")
+    async def _fetch_trend(self, state: WorkflowState) -> dict:
+        """Fetch trending content with supervisor review
 
-    async def _fetch_trend(self, state: WorkflowState) -> WorkflowState:
-        """Fetch trending content with supervisor review"""
-        print("\n" + "─" * 50)
-        print("🔥 Step 1: Fetching Topics...")
-        print("─" * 50)
+        노드는 바뀐 키만 반환 (LangGraph가 상태에 병합)
+        """
+        log.info("\n%s\n🔥 Step 1: Fetching Topics...\n%s", _RULE, _RULE)
 
         try:
-            # 트렌드 풀이 비어있으면 새로 가져오기
-            if not state["trends_pool"]:
+            # 남은 후보가 없으면 새로 가져오기 (새 풀은 상태에도 기록)
+            trends_pool = state["trends_pool"]
+            cursor = state["trend_cursor"]
+            update = {}
+            if cursor >= len(trends_pool):
+                from_cache = False
                 content_type = state["content_type"]
 
                 # 1. CUSTOM: 직접 주제 입력
                 if content_type == ContentType.CUSTOM and state.get("topic"):
-                    from ..models import TrendData
+                    # 값이 전부 우리 쪽에서 정해지므로 검증 생략
                     trends = [
-                        TrendData(
+                        TrendData.model_construct(
                             title=state["topic"],
                             source="user_input",
-                            score=100.0,
+                            score=100,
                         )
                     ]
-                    print(f"📝 Custom topic: {state['topic']}")
+                    log.info("📝 Custom topic: %s", state['topic'])
+
+                # 같은 조건으로 최근에 받은 결과가 있으면 재사용 (캐시 켰을 때만)
+                elif (cached := self._load_cached_trends(state)) is not None:
+                    trends = cached
+                    from_cache = True
+                    log.info("♻️ Cached topics (%s)", len(trends))
 
                 # 2. YOUTUBE_SEARCH: YouTube 키워드 검색
                 elif content_type == ContentType.YOUTUBE_SEARCH and state.get(
@@ -179,7 +363,8 @@ class ShortsWorkflow:
                         query=state["search_query"],
                         limit=10,
                     )
-                    print(f"🔍 YouTube search: {state['search_query']}")
+                    log.info("🔍 YouTube search: %s", state['search_query'])
+                    self._store_cached_trends(state, trends)
 
                 # 3. AUTO (기본): LLM 자동 생성
                 else:
@@ -187,152 +372,197 @@ class ShortsWorkflow:
                         category=state.get("category"),
                         limit=5,
                     )
-                    print(f"🤖 Auto-generated topics")
+                    log.info("🤖 Auto-generated topics")
+                    self._store_cached_trends(state, trends)
 
                 if not trends:
-                    return {**state, "error": "No topics found"}
+                    return {"error": "No topics found"}
 
                 # 점수순 정렬
-                trends.sort(key=lambda t: t.score, reverse=True)
-                state = {**state, "trends_pool": trends}
+                trends.sort(key=attrgetter("score"), reverse=True)
+                trends_pool = trends
+                # 캐시된 풀은 배치 안의 쇼츠들이 같이 쓰므로 쇼츠마다 다른
+                # 후보부터 시작 (안 그러면 전부 같은 1등 주제로 만들어짐)
+                cursor = (state["batch_index"] % len(trends_pool)
+                          if from_cache else 0)
+                update["trends_pool"] = trends_pool
 
             # 가장 높은 점수의 트렌드 선택
-            trends_pool = state["trends_pool"]
-            if not trends_pool:
-                return {
-                    **state, "error": "All trends rejected, no more candidates"
-                }
-
-            trend = trends_pool[0]
-            remaining = trends_pool[1:]
-
-            print(f"📌 Candidate: {trend.title[:50]}...")
-            print(f"   Score: {trend.score} | Source: {trend.source}")
-
-            # 감독 평가
-            if self.strict_mode:
-                feedback = await self.supervisor.review_trend(trend)
+            if cursor >= len(trends_pool):
+                return {"error": "All trends rejected, no more candidates"}
+
+            if not self.strict_mode:
+                trend = trends_pool[cursor]
+                log.info("📌 Candidate: %.50s...", trend.title)
+                log.info("   Score: %s | Source: %s", trend.score, trend.source)
+                log.info("✅ APPROVED: %.40s...", trend.title)
+                return {**update, "trend": trend, "trend_cursor": cursor + 1}
+
+            # 감독 평가 - 남은 재시도 횟수만큼 상위 후보를 한 번에 동시 평가
+            attempts = state["trend_attempts"]
+            candidates = trends_pool[cursor:cursor + MAX_RETRIES - attempts]
+            # 하나라도 실패하면 나머지 평가 요청도 바로 취소
+            async with asyncio.TaskGroup() as tg:
+                reviews = [
+                    tg.create_task(self.supervisor.review_trend(t))
+                    for t in candidates
+                ]
+            feedbacks = [r.result() for r in reviews]
+
+            # 점수순으로 보면서 처음 통과한 후보 선택
+            for i, (trend, feedback) in enumerate(zip(candidates, feedbacks)):
+                log.info("📌 Candidate: %.50s...", trend.title)
+                log.info("   Score: %s | Source: %s", trend.score, trend.source)
+                log.info("\n👨‍💼 Supervisor says: %.100s...", feedback.feedback)
+
+                if feedback.result != ReviewResult.REJECTED:
+                    log.info("✅ APPROVED: %.40s...", trend.title)
+                    return {
+                        **update,
+                        "trend": trend,
+                        "trend_cursor": cursor + i + 1,
+                        "trend_attempts": attempts + i + 1,
+                    }
 
-                print(f"\n👨‍💼 Supervisor says: {feedback.feedback[:100]}...")
+                log.warning("❌ REJECTED (attempt %s/%s)", attempts + i + 1,
+                            MAX_RETRIES)
+                log.warning("   Suggestions: %s",
+                            ', '.join(feedback.suggestions[:2]))
 
-                if feedback.result == ReviewResult.REJECTED:
-                    attempts = state["trend_attempts"] + 1
-                    print(f"❌ REJECTED (attempt {attempts}/{MAX_RETRIES})")
-                    print(
-                        f"   Suggestions: {', '.join(feedback.suggestions[:2])}"
-                    )
+            rejected = attempts + len(candidates)
+            return {"error": f"Supervisor rejected {rejected} trends"}
 
-                    if attempts >= MAX_RETRIES:
-                        return {
-                            **state, "error":
-                            f"Supervisor rejected {MAX_RETRIES} trends"
-                        }
+        except Exception as e:
+            return {"error": _error_text(e)}
+
+    @staticmethod
+    def _trend_cache_path(state: WorkflowState) -> Path:
+        """(타입, 카테고리, 검색어, 날짜)별 트렌드 캐시 파일 경로"""
+        key = "|".join([
+            state["content_type"].value,
+            state.get("category") or "",
+            state.get("search_query") or "",
+            date.today().isoformat(),
+        ])
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        return get_settings().output_dir / ".trend_cache" / f"{digest}.json"
+
+    def _load_cached_trends(self,
+                            state: WorkflowState) -> list[TrendData] | None:
+        """TTL 안에 저장된 트렌드 목록 (없거나 만료/손상이면 None)"""
+        ttl = get_settings().trend_cache_ttl
+        if ttl <= 0:
+            return None
 
-                    # 다음 트렌드로 재시도
-                    return {
-                        **state,
-                        "trends_pool": remaining,
-                        "trend_attempts": attempts,
-                    }
+        path = self._trend_cache_path(state)
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return [TrendData.model_validate(t) for t in data]
+        except (OSError, ValueError):
+            return None
 
-            print(f"✅ APPROVED: {trend.title[:40]}...")
-            return {**state, "trend": trend, "trends_pool": remaining}
+    def _store_cached_trends(self, state: WorkflowState,
+                             trends: list[TrendData]) -> None:
+        """트렌드 목록을 캐시 파일로 저장 (캐시 꺼져 있으면 아무것도 안 함)"""
+        if get_settings().trend_cache_ttl <= 0 or not trends:
+            return
 
-        except Exception as e:
-            return {**state, "error": str(e)}
+        path = self._trend_cache_path(state)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([t.model_dump(mode="json") for t in trends],
+                                   ensure_ascii=False),
+                        encoding="utf-8")
 
-    async def _generate_script(self, state: WorkflowState) -> WorkflowState:
+    async def _generate_script(self, state: WorkflowState) -> dict:
         """Generate script with supervisor review"""
-        print("\n" + "─" * 50)
-        print("📝 Step 2: Generating Script...")
-        print("─" * 50)
+        log.info("\n%s\n📝 Step 2: Generating Script...\n%s", _RULE, _RULE)
 
         if state.get("error"):
-            return state
+            return {}
 
         attempts = state["script_attempts"]
 
         while attempts < MAX_RETRIES:
             attempts += 1
-            print(f"\n🔄 Attempt {attempts}/{MAX_RETRIES}")
+            log.info("\n🔄 Attempt %s/%s", attempts, MAX_RETRIES)
 
             try:
                 script = await self.script_agent.run(trend=state["trend"])
 
-                print(
-                    f"   Generated: {len(script.full_text)} chars, {len(script.scene_prompts)} scenes"
-                )
-                print(f"   Hook: {script.hook[:50]}...")
+                log.info("   Generated: %s chars, %s scenes",
+                         len(script.full_text), len(script.scene_prompts))
+                log.info("   Hook: %.50s...", script.hook)
 
                 # 감독 평가
                 if self.strict_mode:
                     feedback = await self.supervisor.review_script(
                         script, state["trend"])
 
-                    print(f"\n👨‍💼 Supervisor (Score: {feedback.score}/10)")
-                    print(f"   {feedback.feedback[:100]}...")
+                    log.info("\n👨‍💼 Supervisor (Score: %s/10)", feedback.score)
+                    log.info("   %.100s...", feedback.feedback)
 
                     if feedback.result == ReviewResult.APPROVED:
-                        print("✅ APPROVED!")
-                        return {
-                            **state, "script": script,
-                            "script_attempts": attempts
-                        }
+                        log.info("✅ APPROVED!")
+                        return {"script": script, "script_attempts": attempts}
 
                     if feedback.result == ReviewResult.REJECTED:
-                        print(f"❌ REJECTED")
+                        log.warning("❌ REJECTED")
                         for s in feedback.suggestions[:2]:
-                            print(f"   → {s}")
+                            log.warning("   → %s", s)
                         continue
 
                     # NEEDS_REVISION - 한번 더 시도
-                    print(f"🔄 NEEDS REVISION")
+                    log.warning("🔄 NEEDS REVISION")
                     for s in feedback.suggestions[:2]:
-                        print(f"   → {s}")
+                        log.warning("   → %s", s)
                     continue
                 else:
-                    return {
-                        **state, "script": script,
-                        "script_attempts": attempts
-                    }
+                    return {"script": script, "script_attempts": attempts}
 
             except Exception as e:
-                print(f"   Error: {e}")
+                log.warning("   Error: %s", e)
                 continue
 
-        return {
-            **state, "error": f"Script rejected after {MAX_RETRIES} attempts"
-        }
+        return {"error": f"Script rejected after {MAX_RETRIES} attempts"}
 
-    async def _generate_images(self, state: WorkflowState) -> WorkflowState:
-        """Generate images with supervisor review"""
-        print("\n" + "─" * 50)
-        print("🎨 Step 3: Generating Images...")
-        print("─" * 50)
+    async def _generate_images(self, state: WorkflowState) -> dict:
+        """Generate images with supervisor review
+
+        오디오 단계와 병렬로 실행되므로 바뀐 키만 반환
+        """
+        log.info("\n%s\n🎨 Step 3: Generating Images...\n%s", _RULE, _RULE)
 
         if state.get("error"):
-            return state
+            return {}
 
         attempts = state["image_attempts"]
 
         while attempts < MAX_RETRIES:
             attempts += 1
-            print(f"\n🔄 Attempt {attempts}/{MAX_RETRIES}")
+            log.info("\n🔄 Attempt %s/%s", attempts, MAX_RETRIES)
 
             try:
-                output_dir = settings.output_dir / state["short_id"] / "images"
+                output_dir = (get_settings().output_dir / state["short_id"] /
+                              "images")
 
                 # 1. 주제 관련 실제 이미지 검색 (첫 번째 이미지)
-                topic_image = await self.image_agent.get_topic_image(
-                    topic=state["trend"].title,
-                    output_dir=output_dir,
-                )
-
                 # 2. AI 생성 이미지들
-                images = await self.image_agent.run(
-                    prompts=state["script"].scene_prompts,
-                    output_dir=output_dir,
-                )
+                # → 다운로드(네트워크)와 SD 생성(GPU)은 서로 독립이라 동시에
+                #   (한쪽이 실패하면 다른 쪽도 취소)
+                async with asyncio.TaskGroup() as tg:
+                    topic_task = tg.create_task(
+                        self.image_agent.get_topic_image(
+                            topic=state["trend"].title,
+                            output_dir=output_dir,
+                        ))
+                    images_task = tg.create_task(
+                        self.image_agent.run(
+                            prompts=state["script"].scene_prompts,
+                            output_dir=output_dir,
+                        ))
+                topic_image, images = topic_task.result(), images_task.result()
 
                 # 3. 주제 이미지를 맨 앞에 추가
                 if topic_image:
@@ -341,64 +571,71 @@ class ShortsWorkflow:
                     for img in images:
                         img.index += 1
                     images = [topic_image] + images
-                    print(f"   🔍 Topic image added: {topic_image.prompt}")
+                    log.info("   🔍 Topic image added: %s", topic_image.prompt)
 
-                print(f"   Generated {len(images)} images")
+                log.info("   Generated %s images", len(images))
 
                 # 감독 평가 (프롬프트 기반)
                 if self.strict_mode:
                     feedback = await self.supervisor.review_images(
                         images, state["script"])
 
-                    print(f"\n👨‍💼 Supervisor (Score: {feedback.score}/10)")
-                    print(f"   {feedback.feedback[:100]}...")
+                    log.info("\n👨‍💼 Supervisor (Score: %s/10)", feedback.score)
+                    log.info("   %.100s...", feedback.feedback)
 
                     if feedback.result == ReviewResult.APPROVED:
-                        print("✅ APPROVED!")
-                        return {
-                            **state, "images": images,
-                            "image_attempts": attempts
-                        }
+                        log.info("✅ APPROVED!")
+                        return self._images_ready(state, images, attempts)
 
                     # 이미지는 비용이 많이 드니 낮은 기준으로 통과
                     if feedback.score >= 6:
-                        print("✅ ACCEPTABLE (score >= 6)")
-                        return {
-                            **state, "images": images,
-                            "image_attempts": attempts
-                        }
+                        log.info("✅ ACCEPTABLE (score >= 6)")
+                        return self._images_ready(state, images, attempts)
 
-                    print(f"❌ REJECTED")
+                    log.warning("❌ REJECTED")
                     continue
                 else:
-                    return {
-                        **state, "images": images,
-                        "image_attempts": attempts
-                    }
+                    return self._images_ready(state, images, attempts)
 
             except Exception as e:
-                print(f"   Error: {e}")
+                log.warning("   Error: %s", _error_text(e))
                 continue
 
-        return {
-            **state, "error": f"Images rejected after {MAX_RETRIES} attempts"
-        }
+        return {"error": f"Images rejected after {MAX_RETRIES} attempts"}
+
+    def _images_ready(self, state: WorkflowState, images: list[ImageResult],
+                      attempts: int) -> dict:
+        """이미지 확정 → TTS가 끝나기 전에 영상 배경 래스터화를 미리 시작"""
+        cancel = threading.Event()
+        self._bg_tasks[state["short_id"]] = (
+            self.video_agent.prepare_background(images, cancel), cancel)
+        return {"images": images, "image_attempts": attempts}
 
-    async def _generate_audio(self, state: WorkflowState) -> WorkflowState:
-        """Generate TTS audio with supervisor review"""
-        print("\n" + "─" * 50)
-        print("🎙️ Step 4: Generating Audio...")
-        print("─" * 50)
+    def _cancel_bg_task(self, short_id: str) -> None:
+        """배경 래스터화 중단 - 스레드엔 이벤트로 알리고 Task는 취소"""
+        entry = self._bg_tasks.pop(short_id, None)
+        if entry:
+            bg_task, cancel = entry
+            cancel.set()
+            bg_task.cancel()
+
+    async def _generate_audio(self, state: WorkflowState) -> dict:
+        """Generate TTS audio with supervisor review
+
+        이미지 단계와 병렬로 실행되므로 바뀐 키만 반환
+        """
+        log.info("\n%s\n🎙️ Step 4: Generating Audio...\n%s", _RULE, _RULE)
 
         if state.get("error"):
-            return state
+            return {}
 
         try:
-            output_path = settings.output_dir / state["short_id"] / "audio.mp3"
+            output_path = (get_settings().output_dir / state["short_id"] /
+                           "audio.mp3")
 
             # 목소리 고정: 소예
             script = state["script"]
-            print(f"   Voice: 소예 (Soye)")
+            log.info("   Voice: 소예 (Soye)")
 
             audio = await self.voice_agent.run(
                 script=script,
@@ -406,38 +643,37 @@ class ShortsWorkflow:
                 voice_id="tc_6837dec48fc46637a9272b88",  # 소예 voice_id
             )
 
-            print(f"   Duration: {audio.duration:.1f}s")
+            log.info("   Duration: %.1fs", audio.duration)
 
             # 감독 평가
             if self.strict_mode:
                 feedback = await self.supervisor.review_audio(
                     audio, state["script"])
 
-                print(f"\n👨‍💼 Supervisor (Score: {feedback.score}/10)")
-                print(f"   {feedback.feedback[:100]}...")
+                log.info("\n👨‍💼 Supervisor (Score: %s/10)", feedback.score)
+                log.info("   %.100s...", feedback.feedback)
 
                 # 오디오는 재생성이 어려우니 경고만
                 if feedback.result == ReviewResult.REJECTED:
-                    print("⚠️ Warning: Audio not ideal, but proceeding...")
+                    log.warning("⚠️ Warning: Audio not ideal, but proceeding...")
 
-            print(f"✅ Audio ready: {audio.duration:.1f}s")
-            return {**state, "audio": audio}
+            log.info("✅ Audio ready: %.1fs", audio.duration)
+            return {"audio": audio}
 
         except Exception as e:
-            return {**state, "error": str(e)}
+            return {"error": str(e)}
 
-    async def _final_review(self, state: WorkflowState) -> WorkflowState:
+    async def _final_review(self, state: WorkflowState) -> dict:
         """Final supervisor review before video creation"""
-        print("\n" + "─" * 50)
-        print("👨‍💼 Step 5: FINAL SUPERVISOR REVIEW")
-        print("─" * 50)
+        log.info("\n%s\n👨‍💼 Step 5: FINAL SUPERVISOR REVIEW\n%s", _RULE,
+                 _RULE)
 
         if state.get("error"):
-            return state
+            return {}
 
         if not self.strict_mode:
-            print("⏭️ Strict mode OFF - skipping final review")
-            return state
+            log.info("⏭️ Strict mode OFF - skipping final review")
+            return {}
 
         feedback = await self.supervisor.final_review(
             trend=state["trend"],
@@ -446,38 +682,37 @@ class ShortsWorkflow:
             audio_duration=state["audio"].duration,
         )
 
-        print(f"\n{'='*50}")
-        print(f"👨‍💼 FINAL VERDICT: {feedback.score}/10")
-        print(f"{'='*50}")
-        print(f"\n{feedback.feedback}")
+        log.info("\n%s\n👨‍💼 FINAL VERDICT: %s/10\n%s", _BAR, feedback.score,
+                 _BAR)
+        log.info("\n%s", feedback.feedback)
 
         if feedback.suggestions:
-            print("\n📋 Notes:")
+            log.info("\n📋 Notes:")
             for s in feedback.suggestions:
-                print(f"   • {s}")
+                log.info("   • %s", s)
 
         if feedback.result == ReviewResult.REJECTED:
-            print("\n❌ FINAL REVIEW FAILED")
-            print("   The supervisor has rejected this Short.")
+            log.error("\n❌ FINAL REVIEW FAILED")
+            log.error("   The supervisor has rejected this Short.")
+            # 영상 안 만들 거니 미리 돌던 배경 래스터화는 바로 중단
+            self._cancel_bg_task(state["short_id"])
             return {
-                **state, "error":
-                "Final review failed - content not up to standards"
+                "error": "Final review failed - content not up to standards"
             }
 
-        print("\n✅ APPROVED FOR VIDEO CREATION!")
-        return state
+        log.info("\n✅ APPROVED FOR VIDEO CREATION!")
+        return {}
 
-    async def _create_video(self, state: WorkflowState) -> WorkflowState:
+    async def _create_video(self, state: WorkflowState) -> dict:
         """Create final video"""
-        print("\n" + "─" * 50)
-        print("🎬 Step 6: Creating Video...")
-        print("─" * 50)
+        log.info("\n%s\n🎬 Step 6: Creating Video...\n%s", _RULE, _RULE)
 
         if state.get("error"):
-            return state
+            return {}
 
         try:
-            output_path = settings.output_dir / state["short_id"] / "final.mp4"
+            output_path = (get_settings().output_dir / state["short_id"] /
+                           "final.mp4")
 
             # 제목 생성 (트렌드 제목 또는 hook 앞부분)
             title = None
@@ -486,7 +721,13 @@ class ShortsWorkflow:
             elif state.get("script") and state["script"].hook:
                 # hook의 첫 문장만 사용
                 hook = state["script"].hook
-                title = hook.split('.')[0].split('?')[0].split('!')[0][:30]
+                title = _SENTENCE_END.split(hook, maxsplit=1)[0][:30]
+
+            # 미리 래스터화해둔 배경이 있으면 사용
+            slides = None
+            entry = self._bg_tasks.pop(state["short_id"], None)
+            if entry:
+                slides = await entry[0]
 
             video = await self.video_agent.run(
                 images=state["images"],
@@ -494,16 +735,16 @@ class ShortsWorkflow:
                 script=state["script"],
                 output_path=output_path,
                 title=title,  # 상단 제목 추가
+                slides=slides,
             )
 
-            print(f"\n{'='*60}")
-            print(f"🎉 VIDEO COMPLETE!")
-            print(f"{'='*60}")
-            print(f"📁 Output: {video.file_path}")
-            print(f"⏱️ Duration: {video.duration:.1f}s")
-            print(f"📐 Resolution: {video.resolution[0]}x{video.resolution[1]}")
+            log.info("\n%s\n🎉 VIDEO COMPLETE!\n%s", _BAR60, _BAR60)
+            log.info("📁 Output: %s", video.file_path)
+            log.info("⏱️ Duration: %.1fs", video.duration)
+            log.info("📐 Resolution: %sx%s", video.resolution[0],
+                     video.resolution[1])
 
-            return {**state, "video": video}
+            return {"video": video}
 
         except Exception as e:
-            return {**state, "error": str(e)}
+            return {"error": str(e)}
@@ -1,93 +1,84 @@
 #!/usr/bin/env python3
 """자막 + 제목 미리보기 테스트"""
 
-from moviepy import ColorClip, TextClip, CompositeVideoClip, ImageClip
+import functools
+
+from moviepy import TextClip
 from PIL import Image
 import numpy as np
 
 WIDTH = 1080
 HEIGHT = 1920
+FONT = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
+
+
+@functools.lru_cache(maxsize=64)
+def render_text(text, font_size, color, stroke_width=0, width=None):
+    """TextClip 렌더링 결과 (RGB, 알파) 캐시 - 같은 글씨는 다시 안 그림"""
+    kwargs = {}
+    if width:
+        kwargs = dict(method="caption", size=(width, None),
+                      text_align="center")
+    if stroke_width:
+        kwargs.update(stroke_color="black", stroke_width=stroke_width)
+    clip = TextClip(text=text, font_size=font_size, color=color, font=FONT,
+                    **kwargs)
+    rgb = clip.get_frame(0).astype(np.float32)
+    alpha = clip.mask.get_frame(0).astype(np.float32)[..., None]
+    return rgb, alpha
+
+
+def fill_center(frame, w, h, y, color):
+    """가로 가운데, 세로 y 위치에 w x h 단색 박스 채우기"""
+    x, y = (WIDTH - w) // 2, int(y)
+    frame[y:y + h, x:x + w] = color
 
-# 배경 (검정)
-bg = ColorClip(size=(WIDTH, HEIGHT), color=(15, 15, 20))
+
+def blend_center(frame, layer, y):
+    """가로 가운데, 세로 y 위치에 글씨 레이어 알파 블렌딩 (frame 직접 수정)"""
+    rgb, alpha = layer
+    h, w = rgb.shape[:2]
+    x, y = (WIDTH - w) // 2, int(y)
+    region = frame[y:y + h, x:x + w]
+    region[:] = (region * (1 - alpha) + rgb * alpha).astype(np.uint8)
+
+# 배경 (검정) - 프레임 버퍼를 바로 만들고 레이어를 직접 덮어씀
+frame = np.full((HEIGHT, WIDTH, 3), (15, 15, 20), dtype=np.uint8)
 
 # 샘플 이미지 영역 표시 (회색 박스로 이미지 위치 표시)
 # 2.4배 확대 크롭이므로 중앙에 작은 영역만 보임
-img_area = ColorClip(size=(int(WIDTH * 0.8), int(HEIGHT * 0.5)),
-                     color=(60, 60, 70))
-img_area = img_area.with_position(("center", "center"))
+fill_center(frame, int(WIDTH * 0.8), int(HEIGHT * 0.5),
+            (HEIGHT - int(HEIGHT * 0.5)) // 2, (60, 60, 70))
 
 # 제목 (상단 크롭 영역)
-title = TextClip(
-    text="삼 년 사귄 여친의 충격 비밀",
-    font_size=52,
-    color="white",
-    font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
-    method="caption",
-    size=(WIDTH - 80, None),
-    text_align="center",
-    stroke_color="black",
-    stroke_width=2,
-)
-title = title.with_position(("center", 70))
+title = render_text("삼 년 사귄 여친의 충격 비밀", 52, "white",
+                    stroke_width=2, width=WIDTH - 80)
 
 # 자막 (하단)
 subtitle_text = "근데 알고 보니까요"
-txt_clip = TextClip(
-    text=subtitle_text,
-    font_size=72,
-    color="white",
-    font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
-    method="caption",
-    size=(WIDTH - 160, None),
-    text_align="center",
-    stroke_color="black",
-    stroke_width=3,
-)
+txt = render_text(subtitle_text, 72, "white",
+                  stroke_width=3, width=WIDTH - 160)
 
 # 자막 배경 박스
-txt_w, txt_h = txt_clip.size
+txt_h, txt_w = txt[0].shape[:2]
 padding_x = 40
 padding_y = 30
-subtitle_bg = ColorClip(
-    size=(txt_w + padding_x * 2, txt_h + padding_y * 2),
-    color=(0, 0, 0),
-)
-subtitle_bg = subtitle_bg.with_position(("center", HEIGHT * 0.72))
-txt_clip = txt_clip.with_position(("center", HEIGHT * 0.72 + padding_y))
+fill_center(frame, txt_w + padding_x * 2, txt_h + padding_y * 2,
+            HEIGHT * 0.72, (0, 0, 0))
 
 # 안내 텍스트
-guide1 = TextClip(
-    text="↑ 상단: 크롭 영역 (제목)",
-    font_size=30,
-    color="yellow",
-    font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
-)
-guide1 = guide1.with_position(("center", 180))
-
-guide2 = TextClip(
-    text="[이미지 영역]",
-    font_size=40,
-    color="gray",
-    font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
-)
-guide2 = guide2.with_position(("center", HEIGHT // 2))
-
-guide3 = TextClip(
-    text="↓ 하단: 자막 영역",
-    font_size=30,
-    color="yellow",
-    font="/System/Library/Fonts/AppleSDGothicNeo.ttc",
-)
-guide3 = guide3.with_position(("center", HEIGHT * 0.72 - 80))
-
-# 합성
-final = CompositeVideoClip(
-    [bg, img_area, title, guide1, guide2, guide3, subtitle_bg, txt_clip],
-    size=(WIDTH, HEIGHT))
-
-# 프레임 추출해서 이미지로 저장
-frame = final.get_frame(0)
+guide1 = render_text("↑ 상단: 크롭 영역 (제목)", 30, "yellow")
+guide2 = render_text("[이미지 영역]", 40, "gray")
+guide3 = render_text("↓ 하단: 자막 영역", 30, "yellow")
+
+# 글씨 합성 (NumPy 알파 블렌딩)
+blend_center(frame, title, 70)
+blend_center(frame, guide1, 180)
+blend_center(frame, guide2, HEIGHT // 2)
+blend_center(frame, guide3, HEIGHT * 0.72 - 80)
+blend_center(frame, txt, HEIGHT * 0.72 + padding_y)
+
+# 이미지로 저장
 img = Image.fromarray(frame)
 img.save("/Users/hyungseok2/project/shorts-automation/preview_layout.png")
 